@@ -5,7 +5,9 @@ These utilities are not part of the public API.
 
 from __future__ import annotations
 
-from datetime import datetime
+import re
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
 from typing import Any
 from urllib.parse import parse_qs, urlparse
 
@@ -20,6 +22,9 @@ from readwise_sdk.exceptions import (
     ValidationError,
 )
 
+# Sort/compare sentinel for missing timestamps; earlier than any real aware datetime.
+MIN_DATETIME = datetime.min.replace(tzinfo=UTC)
+
 
 def handle_response(response: httpx.Response) -> httpx.Response:
     """Handle HTTP response and raise appropriate exceptions.
@@ -108,10 +113,9 @@ def parse_datetime_string(value: Any) -> datetime | None:
     if isinstance(value, datetime):
         return value
     if isinstance(value, str):
-        # Handle Z suffix for UTC
-        v = value.replace("Z", "+00:00")
+        # fromisoformat accepts the "Z" UTC suffix natively on Python 3.11+
         try:
-            return datetime.fromisoformat(v)
+            return datetime.fromisoformat(value)
         except ValueError:
             return None
     return None
@@ -132,3 +136,92 @@ def truncate_string(value: str | None, max_length: int) -> tuple[str | None, boo
     if len(value) <= max_length:
         return value, False
     return value[: max_length - 3] + "...", True
+
+
+def make_text_matcher(query: str, *, case_sensitive: bool = False) -> Callable[[str | None], bool]:
+    """Build a predicate that checks whether a text field contains ``query``.
+
+    The query is case-folded once up front; a plain substring test on the
+    folded text is considerably faster than an IGNORECASE regex search.
+
+    Args:
+        query: The substring to search for.
+        case_sensitive: Whether matching respects case.
+
+    Returns:
+        A function returning True if the given text contains the query. None
+        and empty strings never match a non-empty query.
+    """
+    if case_sensitive:
+        return lambda text: query in (text or "")
+    folded = query.casefold()
+    return lambda text: folded in (text or "").casefold()
+
+
+def make_pattern_matcher(
+    pattern: str, *, case_sensitive: bool = False
+) -> Callable[[str | None], bool]:
+    """Build a predicate that checks whether a text field matches regex ``pattern``.
+
+    Patterns without regex metacharacters use make_text_matcher's substring test
+    instead of the regex engine. Case-insensitively, that shortcut is only taken
+    for ASCII pattern and text, where case folding agrees with ``re.IGNORECASE``;
+    anything else is searched with the compiled regex, so a pattern matches the
+    same texts whether or not it contains metacharacters.
+
+    Args:
+        pattern: The regular expression to search for.
+        case_sensitive: Whether matching respects case.
+
+    Returns:
+        A function returning True if the pattern is found in the given text.
+        None is treated as an empty string.
+    """
+    literal = re.escape(pattern) == pattern
+    if literal and case_sensitive:
+        return make_text_matcher(pattern, case_sensitive=True)
+
+    search = re.compile(pattern, 0 if case_sensitive else re.IGNORECASE).search
+
+    def regex_matcher(text: str | None) -> bool:
+        return search(text or "") is not None
+
+    if not literal or not pattern.isascii():
+        return regex_matcher
+
+    substring_matcher = make_text_matcher(pattern)
+
+    def matcher(text: str | None) -> bool:
+        if text is None or text.isascii():
+            return substring_matcher(text)
+        return regex_matcher(text)
+
+    return matcher
+
+
+def resolve_since(
+    *,
+    days: int | None = None,
+    hours: int | None = None,
+    since: datetime | None = None,
+) -> datetime:
+    """Resolve the ``days``/``hours``/``since`` arguments of the *_since manager methods.
+
+    Args:
+        days: Number of days to look back.
+        hours: Number of hours to look back.
+        since: Specific datetime to look back to. Takes precedence over days/hours.
+
+    Returns:
+        The datetime to look back to.
+
+    Raises:
+        ValueError: If none of the arguments is given.
+    """
+    if since is not None:
+        return since
+    if days is not None:
+        return datetime.now(UTC) - timedelta(days=days)
+    if hours is not None:
+        return datetime.now(UTC) - timedelta(hours=hours)
+    raise ValueError("Must specify days, hours, or since")
@@ -9,7 +9,12 @@ from typing import TYPE_CHECKING, Any
 import httpx
 
 from readwise_sdk._utils import handle_response, parse_pagination_cursor
-from readwise_sdk.exceptions import AuthenticationError, RateLimitError, ReadwiseError
+from readwise_sdk.exceptions import (
+    AuthenticationError,
+    NotFoundError,
+    RateLimitError,
+    ReadwiseError,
+)
 
 if TYPE_CHECKING:
     from collections.abc import AsyncIterator, Iterator
@@ -27,6 +32,10 @@ READWISE_API_V3_BASE = "https://readwise.io/api/v3"
 DEFAULT_TIMEOUT = 30.0
 DEFAULT_MAX_RETRIES = 3
 DEFAULT_RETRY_BACKOFF = 0.5
+# Readwise rate-limits the v2 list endpoints to 20 requests per minute, so
+# concurrent page fetches stay conservative by default.
+DEFAULT_PAGE_CONCURRENCY = 2
+DEFAULT_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20)
 
 # User agent string with dynamic version
 _USER_AGENT = f"readwise-plus/{version('readwise-plus')}"
@@ -42,6 +51,8 @@ class BaseClient:
         max_retries: int = DEFAULT_MAX_RETRIES,
         retry_backoff: float = DEFAULT_RETRY_BACKOFF,
         *,
+        limits: httpx.Limits | None = None,
+        http2: bool = False,
         _defer_validation: bool = False,
     ) -> None:
         """Initialize the client.
@@ -51,6 +62,9 @@ class BaseClient:
             timeout: Request timeout in seconds.
             max_retries: Maximum number of retries for failed requests.
             retry_backoff: Base backoff time between retries (exponential).
+            limits: Connection pool limits for the underlying HTTP client.
+            http2: Negotiate HTTP/2 so concurrent requests share one connection.
+                Requires the ``http2`` extra (``pip install 'readwise-plus[http2]'``).
             _defer_validation: Internal flag used by create_optional(). Do not use directly.
         """
         self.api_key = api_key or os.environ.get("READWISE_API_KEY")
@@ -62,6 +76,8 @@ class BaseClient:
         self.timeout = timeout
         self.max_retries = max_retries
         self.retry_backoff = retry_backoff
+        self.limits = limits or DEFAULT_LIMITS
+        self.http2 = http2
 
         self._client: httpx.Client | None = None
 
@@ -80,6 +96,8 @@ class BaseClient:
         if self._client is None:
             self._client = httpx.Client(
                 timeout=self.timeout,
+                limits=self.limits,
+                http2=self.http2,
                 headers={
                     "Authorization": f"Token {self.api_key}",
                     "Content-Type": "application/json",
@@ -162,11 +180,19 @@ class ReadwiseClient(BaseClient):
         max_retries: int = DEFAULT_MAX_RETRIES,
         retry_backoff: float = DEFAULT_RETRY_BACKOFF,
         *,
+        limits: httpx.Limits | None = None,
+        http2: bool = False,
         _defer_validation: bool = False,
     ) -> None:
         """Initialize the client."""
         super().__init__(
-            api_key, timeout, max_retries, retry_backoff, _defer_validation=_defer_validation
+            api_key,
+            timeout,
+            max_retries,
+            retry_backoff,
+            limits=limits,
+            http2=http2,
+            _defer_validation=_defer_validation,
         )
         self._v2: ReadwiseV2Client | None = None
         self._v3: ReadwiseV3Client | None = None
@@ -178,6 +204,9 @@ class ReadwiseClient(BaseClient):
         timeout: float = DEFAULT_TIMEOUT,
         max_retries: int = DEFAULT_MAX_RETRIES,
         retry_backoff: float = DEFAULT_RETRY_BACKOFF,
+        *,
+        limits: httpx.Limits | None = None,
+        http2: bool = False,
     ) -> ReadwiseClient:
         """Create a client that does not raise if no API key is available.
 
@@ -200,6 +229,8 @@ class ReadwiseClient(BaseClient):
             timeout: Request timeout in seconds.
             max_retries: Maximum number of retries for failed requests.
             retry_backoff: Base backoff time between retries (exponential).
+            limits: Connection pool limits for the underlying HTTP client.
+            http2: Negotiate HTTP/2. Requires the ``http2`` extra.
 
         Returns:
             A ReadwiseClient instance that may or may not be configured.
@@ -209,6 +240,8 @@ class ReadwiseClient(BaseClient):
             timeout=timeout,
             max_retries=max_retries,
             retry_backoff=retry_backoff,
+            limits=limits,
+            http2=http2,
             _defer_validation=True,
         )
 
@@ -275,6 +308,49 @@ class ReadwiseClient(BaseClient):
 
             url, params = parse_pagination_cursor(next_cursor, url, params)
 
+    def count_results(
+        self,
+        url: str,
+        params: dict[str, Any] | None = None,
+        results_key: str = "results",
+        cursor_key: str = "next",
+        probe_params: dict[str, Any] | None = None,
+    ) -> int:
+        """Count the items behind a paginated endpoint.
+
+        The ``count`` reported in the first page is used when present, so the
+        total costs a single request. Otherwise the remaining pages are walked
+        and their results counted.
+
+        Args:
+            url: The API endpoint URL.
+            params: Optional query parameters.
+            results_key: Key in response containing the results list.
+            cursor_key: Key in response containing the next page URL/cursor.
+            probe_params: Parameters applied to the first request only, such as
+                a single-item page size. If that response has no ``count``, the
+                endpoint is walked from the start with ``params`` alone.
+
+        Returns:
+            The total number of items.
+        """
+        params = params.copy() if params else {}
+        data = self.get(url, params={**params, **(probe_params or {})}).json()
+
+        count = data.get("count")
+        if count is not None:
+            return count
+        if probe_params:
+            # The probe page is too small to walk efficiently; start over at the normal size.
+            return sum(1 for _ in self.paginate(url, params, results_key, cursor_key))
+
+        total = len(data.get(results_key, []))
+        next_cursor = data.get(cursor_key)
+        if next_cursor:
+            url, params = parse_pagination_cursor(next_cursor, url, params)
+            total += sum(1 for _ in self.paginate(url, params, results_key, cursor_key))
+        return total
+
 
 class AsyncReadwiseClient:
     """Asynchronous Readwise client with access to v2 and v3 APIs.
@@ -301,6 +377,8 @@ class AsyncReadwiseClient:
         max_retries: int = DEFAULT_MAX_RETRIES,
         retry_backoff: float = DEFAULT_RETRY_BACKOFF,
         *,
+        limits: httpx.Limits | None = None,
+        http2: bool = False,
         _defer_validation: bool = False,
     ) -> None:
         """Initialize the async client.
@@ -310,6 +388,10 @@ class AsyncReadwiseClient:
             timeout: Request timeout in seconds.
             max_retries: Maximum number of retries for failed requests.
             retry_backoff: Base backoff time between retries (exponential).
+            limits: Connection pool limits for the underlying HTTP client. Raise these
+                when issuing many concurrent requests.
+            http2: Negotiate HTTP/2 so concurrent requests share one connection.
+                Requires the ``http2`` extra (``pip install 'readwise-plus[http2]'``).
             _defer_validation: Internal flag used by create_optional(). Do not use directly.
         """
         self.api_key = api_key or os.environ.get("READWISE_API_KEY")
@@ -321,6 +403,8 @@ class AsyncReadwiseClient:
         self.timeout = timeout
         self.max_retries = max_retries
         self.retry_backoff = retry_backoff
+        self.limits = limits or DEFAULT_LIMITS
+        self.http2 = http2
 
         self._client: httpx.AsyncClient | None = None
         self._v2: AsyncReadwiseV2Client | None = None
@@ -342,6 +426,9 @@ class AsyncReadwiseClient:
         timeout: float = DEFAULT_TIMEOUT,
         max_retries: int = DEFAULT_MAX_RETRIES,
         retry_backoff: float = DEFAULT_RETRY_BACKOFF,
+        *,
+        limits: httpx.Limits | None = None,
+        http2: bool = False,
     ) -> AsyncReadwiseClient:
         """Create an async client that does not raise if no API key is available.
 
@@ -365,6 +452,8 @@ class AsyncReadwiseClient:
             timeout: Request timeout in seconds.
             max_retries: Maximum number of retries for failed requests.
             retry_backoff: Base backoff time between retries (exponential).
+            limits: Connection pool limits for the underlying HTTP client.
+            http2: Negotiate HTTP/2. Requires the ``http2`` extra.
 
         Returns:
             An AsyncReadwiseClient instance that may or may not be configured.
@@ -374,6 +463,8 @@ class AsyncReadwiseClient:
             timeout=timeout,
             max_retries=max_retries,
             retry_backoff=retry_backoff,
+            limits=limits,
+            http2=http2,
             _defer_validation=True,
         )
 
@@ -383,6 +474,8 @@ class AsyncReadwiseClient:
         if self._client is None:
             self._client = httpx.AsyncClient(
                 timeout=self.timeout,
+                limits=self.limits,
+                http2=self.http2,
                 headers={
                     "Authorization": f"Token {self.api_key}",
                     "Content-Type": "application/json",
@@ -517,3 +610,118 @@ class AsyncReadwiseClient:
                 break
 
             url, params = parse_pagination_cursor(next_cursor, url, params)
+
+    async def count_results(
+        self,
+        url: str,
+        params: dict[str, Any] | None = None,
+        results_key: str = "results",
+        cursor_key: str = "next",
+        probe_params: dict[str, Any] | None = None,
+    ) -> int:
+        """Count the items behind a paginated endpoint.
+
+        The ``count`` reported in the first page is used when present, so the
+        total costs a single request. Otherwise the remaining pages are walked
+        and their results counted.
+
+        Args:
+            url: The API endpoint URL.
+            params: Optional query parameters.
+            results_key: Key in response containing the results list.
+            cursor_key: Key in response containing the next page URL/cursor.
+            probe_params: Parameters applied to the first request only, such as
+                a single-item page size. If that response has no ``count``, the
+                endpoint is walked from the start with ``params`` alone.
+
+        Returns:
+            The total number of items.
+        """
+        params = params.copy() if params else {}
+        response = await self.get(url, params={**params, **(probe_params or {})})
+        data = response.json()
+
+        count = data.get("count")
+        if count is not None:
+            return count
+        if probe_params:
+            # The probe page is too small to walk efficiently; start over at the normal size.
+            return sum([1 async for _ in self.paginate(url, params, results_key, cursor_key)])
+
+        total = len(data.get(results_key, []))
+        next_cursor = data.get(cursor_key)
+        if next_cursor:
+            url, params = parse_pagination_cursor(next_cursor, url, params)
+            async for _ in self.paginate(url, params, results_key, cursor_key):
+                total += 1
+        return total
+
+    async def fetch_all_pages(
+        self,
+        url: str,
+        params: dict[str, Any] | None = None,
+        results_key: str = "results",
+        max_concurrency: int = DEFAULT_PAGE_CONCURRENCY,
+    ) -> list[dict[str, Any]]:
+        """Fetch every page of a page-numbered endpoint, requesting pages concurrently.
+
+        The first page is fetched on its own to learn the total ``count``. The
+        remaining pages are then requested by ``page`` number, up to
+        ``max_concurrency`` at a time. If the last of those pages still links to
+        a ``next`` page (items were added while fetching), pagination continues
+        sequentially from there. Endpoints that do not report a count are
+        paginated sequentially throughout.
+
+        Args:
+            url: The API endpoint URL.
+            params: Optional query parameters.
+            results_key: Key in response containing the results list.
+            max_concurrency: Maximum number of page requests in flight at once.
+
+        Returns:
+            All result items, in page order.
+
+        Raises:
+            ValueError: If max_concurrency is less than 1.
+        """
+        import asyncio
+
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        params = params.copy() if params else {}
+
+        async def fetch_page(page: int) -> dict[str, Any] | None:
+            try:
+                page_response = await self.get(url, params={**params, "page": page})
+            except NotFoundError:
+                # Items were removed since the count was taken; the page no longer exists.
+                return None
+            return page_response.json()
+
+        response = await self.get(url, params=params)
+        data = response.json()
+        results: list[dict[str, Any]] = list(data.get(results_key, []))
+
+        next_cursor = data.get("next")
+        if not next_cursor:
+            return results
+
+        count = data.get("count")
+        page_size = len(results)
+        if count and page_size:
+            last_page = -(-count // page_size)
+            for start in range(2, last_page + 1, max_concurrency):
+                pages = range(start, min(start + max_concurrency, last_page + 1))
+                for page_data in await asyncio.gather(*(fetch_page(page) for page in pages)):
+                    if page_data is None:
+                        return results
+                    results.extend(page_data.get(results_key, []))
+                    next_cursor = page_data.get("next")
+                    if not next_cursor:
+                        return results
+
+        # Either no count was reported, or the collection grew past it.
+        next_url, next_params = parse_pagination_cursor(next_cursor, url, params)
+        results.extend([item async for item in self.paginate(next_url, next_params)])
+        return results
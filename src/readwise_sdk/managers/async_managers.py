@@ -11,23 +11,49 @@ Example:
 
 from __future__ import annotations
 
+import asyncio
 import json
-from collections import Counter
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-from readwise_sdk.managers.books import BookWithHighlights, ReadingStats
-from readwise_sdk.managers.documents import InboxStats
+from readwise_sdk._utils import make_text_matcher, resolve_since
+from readwise_sdk.managers.books import (
+    BookWithHighlights,
+    ReadingStats,
+    _build_reading_stats,
+    _most_recent,
+)
+from readwise_sdk.managers.documents import InboxStats, InboxStatsBuilder
 from readwise_sdk.managers.sync import SyncResult, SyncState
 from readwise_sdk.v2.models import Book, BookCategory, Highlight, HighlightCreate
 from readwise_sdk.v3.models import Document, DocumentCategory, DocumentLocation
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncIterator, Callable
+    from collections.abc import AsyncIterator, Awaitable, Callable, Hashable
 
     from readwise_sdk.client import AsyncReadwiseClient
 
+DEFAULT_BULK_CONCURRENCY = 8
+
+
+async def _run_bulk[K: Hashable](
+    ids: list[K],
+    action: Callable[[K], Awaitable[object]],
+    max_concurrency: int,
+) -> dict[K, bool]:
+    """Run ``action`` for every ID concurrently, mapping each ID to success status."""
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be at least 1")
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def run(item: K) -> None:
+        async with semaphore:
+            await action(item)
+
+    outcomes = await asyncio.gather(*(run(i) for i in ids), return_exceptions=True)
+    return {i: not isinstance(o, BaseException) for i, o in zip(ids, outcomes, strict=True)}
+
 
 class AsyncHighlightManager:
     """Async high-level operations for managing highlights."""
@@ -43,10 +69,12 @@ class AsyncHighlightManager:
     async def get_all_highlights(self) -> list[Highlight]:
         """Get all highlights, exhausting pagination.
 
+        Pages are requested concurrently once the total count is known.
+
         Returns:
             List of all highlights.
         """
-        return [h async for h in self._client.v2.list_highlights()]
+        return await self._client.v2.fetch_all_highlights()
 
     async def get_highlights_since(
         self,
@@ -65,13 +93,7 @@ class AsyncHighlightManager:
         Returns:
             List of highlights updated since the given time.
         """
-        if since is None:
-            if days is not None:
-                since = datetime.now(UTC) - timedelta(days=days)
-            elif hours is not None:
-                since = datetime.now(UTC) - timedelta(hours=hours)
-            else:
-                raise ValueError("Must specify days, hours, or since")
+        since = resolve_since(days=days, hours=hours, since=since)
 
         return [h async for h in self._client.v2.list_highlights(updated_after=since)]
 
@@ -109,15 +131,11 @@ class AsyncHighlightManager:
         Returns:
             List of matching highlights.
         """
-        if not case_sensitive:
-            query = query.lower()
+        matches = make_text_matcher(query, case_sensitive=case_sensitive)
 
         results = []
         async for highlight in self._client.v2.list_highlights():
-            text = highlight.text if case_sensitive else highlight.text.lower()
-            note = (highlight.note or "") if case_sensitive else (highlight.note or "").lower()
-
-            if query in text or query in note:
+            if matches(highlight.text) or matches(highlight.note):
                 results.append(highlight)
 
         return results
@@ -142,50 +160,56 @@ class AsyncHighlightManager:
         self,
         highlight_ids: list[int],
         tag: str,
+        *,
+        max_concurrency: int = DEFAULT_BULK_CONCURRENCY,
     ) -> dict[int, bool]:
         """Add a tag to multiple highlights.
 
         Args:
             highlight_ids: List of highlight IDs to tag.
             tag: The tag name to add.
+            max_concurrency: Maximum number of requests in flight at once.
 
         Returns:
             Dict mapping highlight ID to success status.
+
+        Raises:
+            ValueError: If max_concurrency is less than 1.
         """
-        results: dict[int, bool] = {}
-        for hid in highlight_ids:
-            try:
-                await self._client.v2.create_highlight_tag(hid, tag)
-                results[hid] = True
-            except Exception:
-                results[hid] = False
-        return results
+
+        async def tag_one(hid: int) -> None:
+            await self._client.v2.create_highlight_tag(hid, tag)
+
+        return await _run_bulk(highlight_ids, tag_one, max_concurrency)
 
     async def bulk_untag(
         self,
         highlight_ids: list[int],
         tag: str,
+        *,
+        max_concurrency: int = DEFAULT_BULK_CONCURRENCY,
     ) -> dict[int, bool]:
         """Remove a tag from multiple highlights.
 
         Args:
             highlight_ids: List of highlight IDs.
             tag: The tag name to remove.
+            max_concurrency: Maximum number of highlights processed at once.
 
         Returns:
             Dict mapping highlight ID to success status.
+
+        Raises:
+            ValueError: If max_concurrency is less than 1.
         """
-        results: dict[int, bool] = {}
-        for hid in highlight_ids:
-            try:
-                tags = [t async for t in self._client.v2.list_highlight_tags(hid)]
-                tag_obj = next((t for t in tags if t.name == tag), None)
-                if tag_obj:
-                    await self._client.v2.delete_highlight_tag(hid, tag_obj.id)
-                results[hid] = True
-            except Exception:
-                results[hid] = False
-        return results
+
+        async def untag_one(hid: int) -> None:
+            tags = [t async for t in self._client.v2.list_highlight_tags(hid)]
+            tag_obj = next((t for t in tags if t.name == tag), None)
+            if tag_obj:
+                await self._client.v2.delete_highlight_tag(hid, tag_obj.id)
+
+        return await _run_bulk(highlight_ids, untag_one, max_concurrency)
 
     async def create_highlight(
         self,
@@ -224,10 +248,7 @@ class AsyncHighlightManager:
         Returns:
             Total highlight count.
         """
-        count = 0
-        async for _ in self._client.v2.list_highlights():
-            count += 1
-        return count
+        return await self._client.v2.count_highlights()
 
 
 class AsyncBookManager:
@@ -244,10 +265,12 @@ class AsyncBookManager:
     async def get_all_books(self) -> list[Book]:
         """Get all books, exhausting pagination.
 
+        Pages are requested concurrently once the total count is known.
+
         Returns:
             List of all books.
         """
-        return [b async for b in self._client.v2.list_books()]
+        return await self._client.v2.fetch_all_books()
 
     async def get_books_by_category(self, category: BookCategory) -> list[Book]:
         """Get books filtered by category.
@@ -304,16 +327,7 @@ class AsyncBookManager:
             since = datetime.now(UTC) - timedelta(days=days)
 
         books = [b async for b in self._client.v2.list_books(updated_after=since)]
-
-        books.sort(
-            key=lambda b: b.last_highlight_at or datetime.min.replace(tzinfo=UTC),
-            reverse=True,
-        )
-
-        if limit:
-            books = books[:limit]
-
-        return books
+        return _most_recent(books, limit)
 
     async def get_reading_stats(self) -> ReadingStats:
         """Get aggregated reading statistics.
@@ -322,36 +336,7 @@ class AsyncBookManager:
             ReadingStats with various aggregations.
         """
         books = await self.get_all_books()
-
-        books_by_category: Counter[str] = Counter()
-        highlights_by_category: Counter[str] = Counter()
-        highlights_by_source: Counter[str] = Counter()
-
-        for book in books:
-            cat = book.category.value if book.category else "unknown"
-            books_by_category[cat] += 1
-            highlights_by_category[cat] += book.num_highlights
-
-            source = book.source or "unknown"
-            highlights_by_source[source] += book.num_highlights
-
-        most_highlighted = sorted(
-            [(b.title, b.num_highlights) for b in books],
-            key=lambda x: x[1],
-            reverse=True,
-        )[:10]
-
-        recent = await self.get_recent_books(days=30, limit=10)
-
-        return ReadingStats(
-            total_books=len(books),
-            total_highlights=sum(b.num_highlights for b in books),
-            books_by_category=dict(books_by_category),
-            highlights_by_category=dict(highlights_by_category),
-            highlights_by_source=dict(highlights_by_source),
-            most_highlighted_books=most_highlighted,
-            recent_books=recent,
-        )
+        return _build_reading_stats(books, await self.get_recent_books(days=30, limit=10))
 
     async def search_books(
         self,
@@ -368,15 +353,11 @@ class AsyncBookManager:
         Returns:
             List of matching books.
         """
-        if not case_sensitive:
-            query = query.lower()
+        matches = make_text_matcher(query, case_sensitive=case_sensitive)
 
         results = []
         async for book in self._client.v2.list_books():
-            title = book.title if case_sensitive else book.title.lower()
-            author = (book.author or "") if case_sensitive else (book.author or "").lower()
-
-            if query in title or query in author:
+            if matches(book.title) or matches(book.author):
                 results.append(book)
 
         return results
@@ -387,7 +368,7 @@ class AsyncBookManager:
         Returns:
             Total book count.
         """
-        return len(await self.get_all_books())
+        return await self._client.v2.count_books()
 
 
 class AsyncDocumentManager:
@@ -442,13 +423,7 @@ class AsyncDocumentManager:
         Returns:
             List of documents updated since the given time.
         """
-        if since is None:
-            if days is not None:
-                since = datetime.now(UTC) - timedelta(days=days)
-            elif hours is not None:
-                since = datetime.now(UTC) - timedelta(hours=hours)
-            else:
-                raise ValueError("Must specify days, hours, or since")
+        since = resolve_since(days=days, hours=hours, since=since)
 
         return [d async for d in self._client.v3.list_documents(updated_after=since)]
 
@@ -476,46 +451,51 @@ class AsyncDocumentManager:
         """
         await self._client.v3.move_to_inbox(document_id)
 
-    async def bulk_archive(self, document_ids: list[str]) -> dict[str, bool]:
+    async def bulk_archive(
+        self,
+        document_ids: list[str],
+        *,
+        max_concurrency: int = DEFAULT_BULK_CONCURRENCY,
+    ) -> dict[str, bool]:
         """Archive multiple documents.
 
         Args:
             document_ids: List of document IDs.
+            max_concurrency: Maximum number of requests in flight at once.
 
         Returns:
             Dict mapping document ID to success status.
+
+        Raises:
+            ValueError: If max_concurrency is less than 1.
         """
-        results: dict[str, bool] = {}
-        for doc_id in document_ids:
-            try:
-                await self._client.v3.archive(doc_id)
-                results[doc_id] = True
-            except Exception:
-                results[doc_id] = False
-        return results
+        return await _run_bulk(document_ids, self._client.v3.archive, max_concurrency)
 
     async def bulk_tag_documents(
         self,
         document_ids: list[str],
         tags: list[str],
+        *,
+        max_concurrency: int = DEFAULT_BULK_CONCURRENCY,
     ) -> dict[str, bool]:
         """Set tags on multiple documents.
 
         Args:
             document_ids: List of document IDs.
             tags: Tags to set on all documents.
+            max_concurrency: Maximum number of requests in flight at once.
 
         Returns:
             Dict mapping document ID to success status.
+
+        Raises:
+            ValueError: If max_concurrency is less than 1.
         """
-        results: dict[str, bool] = {}
-        for doc_id in document_ids:
-            try:
-                await self._client.v3.tag_document(doc_id, tags)
-                results[doc_id] = True
-            except Exception:
-                results[doc_id] = False
-        return results
+
+        async def tag_one(doc_id: str) -> None:
+            await self._client.v3.tag_document(doc_id, tags)
+
+        return await _run_bulk(document_ids, tag_one, max_concurrency)
 
     async def filter_documents(
         self,
@@ -542,27 +522,32 @@ class AsyncDocumentManager:
         *,
         case_sensitive: bool = False,
         location: DocumentLocation | None = None,
+        category: DocumentCategory | None = None,
+        tag: str | None = None,
     ) -> list[Document]:
         """Search documents by title, author, or summary.
 
+        Location, category, and tag filters are applied by the API, so only
+        candidate documents are downloaded before the text match.
+
         Args:
             query: The search query.
             case_sensitive: Whether to perform case-sensitive search.
             location: Optional location to filter by.
+            category: Optional category to filter by.
+            tag: Optional tag the documents must have.
 
         Returns:
             List of matching documents.
         """
-        if not case_sensitive:
-            query = query.lower()
+        matches = make_text_matcher(query, case_sensitive=case_sensitive)
+        documents = self._client.v3.list_documents(
+            location=location, category=category, tags=[tag] if tag else None
+        )
 
         results = []
-        async for doc in self._client.v3.list_documents(location=location):
-            title = (doc.title or "") if case_sensitive else (doc.title or "").lower()
-            author = (doc.author or "") if case_sensitive else (doc.author or "").lower()
-            summary = (doc.summary or "") if case_sensitive else (doc.summary or "").lower()
-
-            if query in title or query in author or query in summary:
+        async for doc in documents:
+            if matches(doc.title) or matches(doc.author) or matches(doc.summary):
                 results.append(doc)
 
         return results
@@ -570,37 +555,19 @@ class AsyncDocumentManager:
     async def get_inbox_stats(self) -> InboxStats:
         """Get statistics about the reading inbox.
 
+        Documents are tallied as they are paged in rather than collected first.
+
         Returns:
             InboxStats with counts and oldest/newest items.
         """
-        inbox = [d async for d in self._client.v3.get_inbox()]
-        reading_list = [d async for d in self._client.v3.get_reading_list()]
-        archive = [d async for d in self._client.v3.get_archive()]
-
-        by_category: Counter[str] = Counter()
-        for doc in inbox + reading_list:
-            cat = doc.category.value if doc.category else "unknown"
-            by_category[cat] += 1
-
-        oldest = None
-        newest = None
-        if inbox:
-            sorted_inbox = sorted(
-                inbox,
-                key=lambda d: d.created_at or datetime.min.replace(tzinfo=UTC),
-            )
-            oldest = sorted_inbox[0]
-            newest = sorted_inbox[-1]
-
-        return InboxStats(
-            inbox_count=len(inbox),
-            reading_list_count=len(reading_list),
-            archive_count=len(archive),
-            total_count=len(inbox) + len(reading_list) + len(archive),
-            by_category=dict(by_category),
-            oldest_inbox_item=oldest,
-            newest_inbox_item=newest,
-        )
+        stats = InboxStatsBuilder()
+        async for doc in self._client.v3.get_inbox():
+            stats.add_inbox(doc)
+        async for doc in self._client.v3.get_reading_list():
+            stats.add_reading_list(doc)
+        async for doc in self._client.v3.get_archive():
+            stats.add_archive(doc)
+        return stats.build()
 
     async def get_documents_by_category(
         self,
@@ -622,9 +589,10 @@ class AsyncDocumentManager:
         Returns:
             Count of unread documents.
         """
-        inbox = len([d async for d in self._client.v3.get_inbox()])
-        reading_list = len([d async for d in self._client.v3.get_reading_list()])
-        return inbox + reading_list
+        count = 0
+        for location in (DocumentLocation.NEW, DocumentLocation.LATER):
+            count += await self._client.v3.count_documents(location=location)
+        return count
 
 
 class AsyncSyncManager:
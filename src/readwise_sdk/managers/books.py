@@ -2,17 +2,37 @@
 
 from __future__ import annotations
 
+import heapq
 from collections import Counter
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
+from operator import itemgetter
 from typing import TYPE_CHECKING
 
+from readwise_sdk._utils import MIN_DATETIME, make_text_matcher
 from readwise_sdk.v2.models import Book, BookCategory, Highlight
 
 if TYPE_CHECKING:
     from readwise_sdk.client import ReadwiseClient
 
 
+def _last_highlight_key(book: Book) -> datetime:
+    """Sort key placing books without highlights last."""
+    return book.last_highlight_at or MIN_DATETIME
+
+
+def _most_recent(books: list[Book], limit: int | None) -> list[Book]:
+    """Order books by last highlight, newest first, keeping at most ``limit``."""
+    if limit:
+        return heapq.nlargest(limit, books, key=_last_highlight_key)
+    return sorted(books, key=_last_highlight_key, reverse=True)
+
+
+def _most_highlighted(books: list[Book], limit: int = 10) -> list[tuple[str, int]]:
+    """Return ``(title, num_highlights)`` for the most highlighted books."""
+    return heapq.nlargest(limit, ((b.title, b.num_highlights) for b in books), key=itemgetter(1))
+
+
 @dataclass
 class BookWithHighlights:
     """A book with its associated highlights."""
@@ -34,6 +54,36 @@ class ReadingStats:
     recent_books: list[Book]
 
 
+def _build_reading_stats(books: list[Book], recent_books: list[Book]) -> ReadingStats:
+    """Aggregate per-category and per-source counts over ``books``.
+
+    All counts are tallied in one loop; the most highlighted books are then
+    selected with a separate bounded heap pass.
+    """
+    books_by_category: Counter[str] = Counter()
+    highlights_by_category: Counter[str] = Counter()
+    highlights_by_source: Counter[str] = Counter()
+    total_highlights = 0
+
+    for book in books:
+        cat = book.category.value if book.category else "unknown"
+        num = book.num_highlights
+        total_highlights += num
+        books_by_category[cat] += 1
+        highlights_by_category[cat] += num
+        highlights_by_source[book.source or "unknown"] += num
+
+    return ReadingStats(
+        total_books=len(books),
+        total_highlights=total_highlights,
+        books_by_category=dict(books_by_category),
+        highlights_by_category=dict(highlights_by_category),
+        highlights_by_source=dict(highlights_by_source),
+        most_highlighted_books=_most_highlighted(books),
+        recent_books=recent_books,
+    )
+
+
 class BookManager:
     """High-level operations for managing books."""
 
@@ -108,17 +158,7 @@ class BookManager:
             since = datetime.now(UTC) - timedelta(days=days)
 
         books = list(self._client.v2.list_books(updated_after=since))
-
-        # Sort by last_highlight_at descending
-        books.sort(
-            key=lambda b: b.last_highlight_at or datetime.min.replace(tzinfo=UTC),
-            reverse=True,
-        )
-
-        if limit:
-            books = books[:limit]
-
-        return books
+        return _most_recent(books, limit)
 
     def get_reading_stats(self) -> ReadingStats:
         """Get aggregated reading statistics.
@@ -127,39 +167,7 @@ class BookManager:
             ReadingStats with various aggregations.
         """
         books = self.get_all_books()
-
-        # Aggregate by category
-        books_by_category: Counter[str] = Counter()
-        highlights_by_category: Counter[str] = Counter()
-        highlights_by_source: Counter[str] = Counter()
-
-        for book in books:
-            cat = book.category.value if book.category else "unknown"
-            books_by_category[cat] += 1
-            highlights_by_category[cat] += book.num_highlights
-
-            source = book.source or "unknown"
-            highlights_by_source[source] += book.num_highlights
-
-        # Most highlighted books
-        most_highlighted = sorted(
-            [(b.title, b.num_highlights) for b in books],
-            key=lambda x: x[1],
-            reverse=True,
-        )[:10]
-
-        # Recent books
-        recent = self.get_recent_books(days=30, limit=10)
-
-        return ReadingStats(
-            total_books=len(books),
-            total_highlights=sum(b.num_highlights for b in books),
-            books_by_category=dict(books_by_category),
-            highlights_by_category=dict(highlights_by_category),
-            highlights_by_source=dict(highlights_by_source),
-            most_highlighted_books=most_highlighted,
-            recent_books=recent,
-        )
+        return _build_reading_stats(books, self.get_recent_books(days=30, limit=10))
 
     def search_books(
         self,
@@ -176,15 +184,11 @@ class BookManager:
         Returns:
             List of matching books.
         """
-        if not case_sensitive:
-            query = query.lower()
+        matches = make_text_matcher(query, case_sensitive=case_sensitive)
 
         results = []
         for book in self._client.v2.list_books():
-            title = book.title if case_sensitive else book.title.lower()
-            author = (book.author or "") if case_sensitive else (book.author or "").lower()
-
-            if query in title or query in author:
+            if matches(book.title) or matches(book.author):
                 results.append(book)
 
         return results
@@ -195,4 +199,4 @@ class BookManager:
         Returns:
             Total book count.
         """
-        return len(self.get_all_books())
+        return self._client.v2.count_books()
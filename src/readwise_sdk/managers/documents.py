@@ -4,9 +4,10 @@ from __future__ import annotations
 
 from collections import Counter
 from dataclasses import dataclass
-from datetime import UTC, datetime, timedelta
+from datetime import datetime
 from typing import TYPE_CHECKING
 
+from readwise_sdk._utils import MIN_DATETIME, make_text_matcher, resolve_since
 from readwise_sdk.v3.models import Document, DocumentCategory, DocumentLocation
 
 if TYPE_CHECKING:
@@ -28,6 +29,54 @@ class InboxStats:
     newest_inbox_item: Document | None
 
 
+class InboxStatsBuilder:
+    """Running tallies for InboxStats, fed one document at a time."""
+
+    def __init__(self) -> None:
+        self.inbox_count = 0
+        self.reading_list_count = 0
+        self.archive_count = 0
+        self.by_category: Counter[str] = Counter()
+        self.oldest: Document | None = None
+        self.newest: Document | None = None
+        self._oldest_at = MIN_DATETIME
+        self._newest_at = MIN_DATETIME
+
+    def _count_category(self, doc: Document) -> None:
+        self.by_category[doc.category.value if doc.category else "unknown"] += 1
+
+    def add_inbox(self, doc: Document) -> None:
+        """Count an inbox document and track the oldest/newest by creation time."""
+        self.inbox_count += 1
+        self._count_category(doc)
+        created_at = doc.created_at or MIN_DATETIME
+        if self.oldest is None or created_at < self._oldest_at:
+            self.oldest, self._oldest_at = doc, created_at
+        if created_at >= self._newest_at:
+            self.newest, self._newest_at = doc, created_at
+
+    def add_reading_list(self, doc: Document) -> None:
+        """Count a reading list document."""
+        self.reading_list_count += 1
+        self._count_category(doc)
+
+    def add_archive(self, doc: Document) -> None:
+        """Count an archived document."""
+        self.archive_count += 1
+
+    def build(self) -> InboxStats:
+        """Produce the final InboxStats."""
+        return InboxStats(
+            inbox_count=self.inbox_count,
+            reading_list_count=self.reading_list_count,
+            archive_count=self.archive_count,
+            total_count=self.inbox_count + self.reading_list_count + self.archive_count,
+            by_category=dict(self.by_category),
+            oldest_inbox_item=self.oldest,
+            newest_inbox_item=self.newest,
+        )
+
+
 class DocumentManager:
     """High-level operations for managing Reader documents."""
 
@@ -80,13 +129,7 @@ class DocumentManager:
         Returns:
             List of documents updated since the given time.
         """
-        if since is None:
-            if days is not None:
-                since = datetime.now(UTC) - timedelta(days=days)
-            elif hours is not None:
-                since = datetime.now(UTC) - timedelta(hours=hours)
-            else:
-                raise ValueError("Must specify days, hours, or since")
+        since = resolve_since(days=days, hours=hours, since=since)
 
         return list(self._client.v3.list_documents(updated_after=since))
 
@@ -180,27 +223,32 @@ class DocumentManager:
         *,
         case_sensitive: bool = False,
         location: DocumentLocation | None = None,
+        category: DocumentCategory | None = None,
+        tag: str | None = None,
     ) -> list[Document]:
         """Search documents by title, author, or summary.
 
+        Location, category, and tag filters are applied by the API, so only
+        candidate documents are downloaded before the text match.
+
         Args:
             query: The search query.
             case_sensitive: Whether to perform case-sensitive search.
             location: Optional location to filter by.
+            category: Optional category to filter by.
+            tag: Optional tag the documents must have.
 
         Returns:
             List of matching documents.
         """
-        if not case_sensitive:
-            query = query.lower()
+        matches = make_text_matcher(query, case_sensitive=case_sensitive)
+        documents = self._client.v3.list_documents(
+            location=location, category=category, tags=[tag] if tag else None
+        )
 
         results = []
-        for doc in self._client.v3.list_documents(location=location):
-            title = (doc.title or "") if case_sensitive else (doc.title or "").lower()
-            author = (doc.author or "") if case_sensitive else (doc.author or "").lower()
-            summary = (doc.summary or "") if case_sensitive else (doc.summary or "").lower()
-
-            if query in title or query in author or query in summary:
+        for doc in documents:
+            if matches(doc.title) or matches(doc.author) or matches(doc.summary):
                 results.append(doc)
 
         return results
@@ -208,39 +256,19 @@ class DocumentManager:
     def get_inbox_stats(self) -> InboxStats:
         """Get statistics about the reading inbox.
 
+        Documents are tallied as they are paged in rather than collected first.
+
         Returns:
             InboxStats with counts and oldest/newest items.
         """
-        inbox = list(self._client.v3.get_inbox())
-        reading_list = list(self._client.v3.get_reading_list())
-        archive = list(self._client.v3.get_archive())
-
-        # Count by category
-        by_category: Counter[str] = Counter()
-        for doc in inbox + reading_list:
-            cat = doc.category.value if doc.category else "unknown"
-            by_category[cat] += 1
-
-        # Find oldest/newest inbox items
-        oldest = None
-        newest = None
-        if inbox:
-            sorted_inbox = sorted(
-                inbox,
-                key=lambda d: d.created_at or datetime.min.replace(tzinfo=UTC),
-            )
-            oldest = sorted_inbox[0]
-            newest = sorted_inbox[-1]
-
-        return InboxStats(
-            inbox_count=len(inbox),
-            reading_list_count=len(reading_list),
-            archive_count=len(archive),
-            total_count=len(inbox) + len(reading_list) + len(archive),
-            by_category=dict(by_category),
-            oldest_inbox_item=oldest,
-            newest_inbox_item=newest,
-        )
+        stats = InboxStatsBuilder()
+        for doc in self._client.v3.get_inbox():
+            stats.add_inbox(doc)
+        for doc in self._client.v3.get_reading_list():
+            stats.add_reading_list(doc)
+        for doc in self._client.v3.get_archive():
+            stats.add_archive(doc)
+        return stats.build()
 
     def get_documents_by_category(
         self,
@@ -262,6 +290,7 @@ class DocumentManager:
         Returns:
             Count of unread documents.
         """
-        inbox = len(list(self._client.v3.get_inbox()))
-        reading_list = len(list(self._client.v3.get_reading_list()))
-        return inbox + reading_list
+        return sum(
+            self._client.v3.count_documents(location=location)
+            for location in (DocumentLocation.NEW, DocumentLocation.LATER)
+        )
@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
-from datetime import UTC, datetime, timedelta
+from datetime import datetime
 from typing import TYPE_CHECKING
 
+from readwise_sdk._utils import make_text_matcher, resolve_since
 from readwise_sdk.v2.models import Highlight, HighlightCreate
 
 if TYPE_CHECKING:
@@ -49,13 +50,7 @@ class HighlightManager:
         Returns:
             List of highlights updated since the given time.
         """
-        if since is None:
-            if days is not None:
-                since = datetime.now(UTC) - timedelta(days=days)
-            elif hours is not None:
-                since = datetime.now(UTC) - timedelta(hours=hours)
-            else:
-                raise ValueError("Must specify days, hours, or since")
+        since = resolve_since(days=days, hours=hours, since=since)
 
         return list(self._client.v2.list_highlights(updated_after=since))
 
@@ -93,15 +88,11 @@ class HighlightManager:
         Returns:
             List of matching highlights.
         """
-        if not case_sensitive:
-            query = query.lower()
+        matches = make_text_matcher(query, case_sensitive=case_sensitive)
 
         results = []
         for highlight in self._client.v2.list_highlights():
-            text = highlight.text if case_sensitive else highlight.text.lower()
-            note = (highlight.note or "") if case_sensitive else (highlight.note or "").lower()
-
-            if query in text or query in note:
+            if matches(highlight.text) or matches(highlight.note):
                 results.append(highlight)
 
         return results
@@ -209,7 +200,4 @@ class HighlightManager:
         Returns:
             Total highlight count.
         """
-        count = 0
-        for _ in self._client.v2.list_highlights():
-            count += 1
-        return count
+        return self._client.v2.count_highlights()
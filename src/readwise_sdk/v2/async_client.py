@@ -5,7 +5,7 @@ from __future__ import annotations
 from datetime import datetime
 from typing import TYPE_CHECKING, Any
 
-from readwise_sdk.client import READWISE_API_V2_BASE
+from readwise_sdk.client import DEFAULT_PAGE_CONCURRENCY, READWISE_API_V2_BASE
 from readwise_sdk.v2.models import (
     Book,
     BookCategory,
@@ -97,6 +97,49 @@ class AsyncReadwiseV2Client:
         ):
             yield Highlight.model_validate(item)
 
+    async def fetch_all_highlights(
+        self,
+        *,
+        page_size: int = 100,
+        max_concurrency: int = DEFAULT_PAGE_CONCURRENCY,
+    ) -> list[Highlight]:
+        """Fetch every highlight, requesting pages concurrently once the count is known.
+
+        The v2 list endpoints are rate-limited to 20 requests per minute. Raising
+        ``max_concurrency`` speeds up small exports, but large ones then exhaust
+        the limit sooner and spend the time in 429 retries instead. A larger
+        ``page_size`` is usually the better way to reduce the request count.
+
+        Args:
+            page_size: Number of results per page (max 1000).
+            max_concurrency: Maximum number of page requests in flight at once.
+
+        Returns:
+            All highlights, in page order.
+        """
+        items = await self._client.fetch_all_pages(
+            f"{READWISE_API_V2_BASE}/highlights/",
+            params={"page_size": min(page_size, 1000)},
+            max_concurrency=max_concurrency,
+        )
+        return [Highlight.model_validate(item) for item in items]
+
+    async def count_highlights(self) -> int:
+        """Count all highlights.
+
+        Only the response's ``count`` is needed, so a single-item page is
+        requested. If the API omits the count, every page is walked at the
+        default page size instead.
+
+        Returns:
+            Total highlight count.
+        """
+        return await self._client.count_results(
+            f"{READWISE_API_V2_BASE}/highlights/",
+            params={"page_size": 100},
+            probe_params={"page_size": 1},
+        )
+
     async def get_highlight(self, highlight_id: int) -> Highlight:
         """Get a single highlight by ID.
 
@@ -211,6 +254,49 @@ class AsyncReadwiseV2Client:
         ):
             yield Book.model_validate(item)
 
+    async def fetch_all_books(
+        self,
+        *,
+        page_size: int = 100,
+        max_concurrency: int = DEFAULT_PAGE_CONCURRENCY,
+    ) -> list[Book]:
+        """Fetch every book, requesting pages concurrently once the count is known.
+
+        The v2 list endpoints are rate-limited to 20 requests per minute. Raising
+        ``max_concurrency`` speeds up small exports, but large ones then exhaust
+        the limit sooner and spend the time in 429 retries instead. A larger
+        ``page_size`` is usually the better way to reduce the request count.
+
+        Args:
+            page_size: Number of results per page (max 1000).
+            max_concurrency: Maximum number of page requests in flight at once.
+
+        Returns:
+            All books, in page order.
+        """
+        items = await self._client.fetch_all_pages(
+            f"{READWISE_API_V2_BASE}/books/",
+            params={"page_size": min(page_size, 1000)},
+            max_concurrency=max_concurrency,
+        )
+        return [Book.model_validate(item) for item in items]
+
+    async def count_books(self) -> int:
+        """Count all books.
+
+        Only the response's ``count`` is needed, so a single-item page is
+        requested. If the API omits the count, every page is walked at the
+        default page size instead.
+
+        Returns:
+            Total book count.
+        """
+        return await self._client.count_results(
+            f"{READWISE_API_V2_BASE}/books/",
+            params={"page_size": 100},
+            probe_params={"page_size": 1},
+        )
+
     async def get_book(self, book_id: int) -> Book:
         """Get a single book by ID.
 
@@ -76,6 +76,22 @@ class ReadwiseV2Client:
         ):
             yield Highlight.model_validate(item)
 
+    def count_highlights(self) -> int:
+        """Count all highlights.
+
+        Only the response's ``count`` is needed, so a single-item page is
+        requested. If the API omits the count, every page is walked at the
+        default page size instead.
+
+        Returns:
+            Total highlight count.
+        """
+        return self._client.count_results(
+            f"{READWISE_API_V2_BASE}/highlights/",
+            params={"page_size": 100},
+            probe_params={"page_size": 1},
+        )
+
     def get_highlight(self, highlight_id: int) -> Highlight:
         """Get a single highlight by ID.
 
@@ -190,6 +206,22 @@ class ReadwiseV2Client:
         ):
             yield Book.model_validate(item)
 
+    def count_books(self) -> int:
+        """Count all books.
+
+        Only the response's ``count`` is needed, so a single-item page is
+        requested. If the API omits the count, every page is walked at the
+        default page size instead.
+
+        Returns:
+            Total book count.
+        """
+        return self._client.count_results(
+            f"{READWISE_API_V2_BASE}/books/",
+            params={"page_size": 100},
+            probe_params={"page_size": 1},
+        )
+
     def get_book(self, book_id: int) -> Book:
         """Get a single book by ID.
 
@@ -75,6 +75,22 @@ class ReadwiseV3Client:
         ):
             yield Document.model_validate(item)
 
+    def count_documents(self, *, location: DocumentLocation | None = None) -> int:
+        """Count documents, optionally within one location.
+
+        Args:
+            location: Filter by location (new, later, archive, feed).
+
+        Returns:
+            Total document count.
+        """
+        params: dict[str, Any] = {}
+        if location:
+            params["location"] = location.value
+        return self._client.count_results(
+            f"{READWISE_API_V3_BASE}/list/", params=params, cursor_key="nextPageCursor"
+        )
+
     def get_document(self, document_id: str, *, with_content: bool = False) -> Document | None:
         """Get a single document by ID.
 
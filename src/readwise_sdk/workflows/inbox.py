@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
-import re
+from collections import Counter
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 from typing import TYPE_CHECKING
 
+from readwise_sdk._utils import make_pattern_matcher, make_text_matcher
 from readwise_sdk.v3.models import Document, DocumentCategory, DocumentLocation
 
 if TYPE_CHECKING:
@@ -15,6 +16,18 @@ if TYPE_CHECKING:
     from readwise_sdk.client import ReadwiseClient
 
 
+# Triage order for get_inbox_by_priority (lower is higher priority)
+_CATEGORY_PRIORITY: dict[DocumentCategory, int] = {
+    DocumentCategory.ARTICLE: 0,
+    DocumentCategory.EMAIL: 1,
+    DocumentCategory.RSS: 2,
+    DocumentCategory.PDF: 3,
+    DocumentCategory.EPUB: 4,
+    DocumentCategory.TWEET: 5,
+    DocumentCategory.VIDEO: 6,
+}
+
+
 @dataclass
 class ArchiveRule:
     """A rule for auto-archiving documents."""
@@ -38,6 +51,59 @@ class QueueStats:
     items_older_than_90_days: int
 
 
+class _QueueStatsBuilder:
+    """Running tallies for QueueStats, fed one document at a time."""
+
+    def __init__(self, now: datetime) -> None:
+        self.now = now
+        self.inbox_count = 0
+        self.reading_list_count = 0
+        self.by_category: Counter[str] = Counter()
+        self.dated_count = 0
+        self.total_age_days = 0
+        self.oldest_age: int | None = None
+        self.items_older_than_30 = 0
+        self.items_older_than_90 = 0
+
+    def _add(self, doc: Document) -> None:
+        self.by_category[doc.category.value if doc.category else "unknown"] += 1
+        if not doc.created_at:
+            return
+        age = (self.now - doc.created_at).days
+        self.dated_count += 1
+        self.total_age_days += age
+        if self.oldest_age is None or age > self.oldest_age:
+            self.oldest_age = age
+        if age > 30:
+            self.items_older_than_30 += 1
+            if age > 90:
+                self.items_older_than_90 += 1
+
+    def add_inbox(self, doc: Document) -> None:
+        """Count an inbox document."""
+        self.inbox_count += 1
+        self._add(doc)
+
+    def add_reading_list(self, doc: Document) -> None:
+        """Count a reading list document."""
+        self.reading_list_count += 1
+        self._add(doc)
+
+    def build(self) -> QueueStats:
+        """Produce the final QueueStats."""
+        average_age = self.total_age_days / self.dated_count if self.dated_count else None
+        return QueueStats(
+            inbox_count=self.inbox_count,
+            reading_list_count=self.reading_list_count,
+            total_unread=self.inbox_count + self.reading_list_count,
+            oldest_item_age_days=self.oldest_age,
+            average_age_days=average_age,
+            by_category=dict(self.by_category),
+            items_older_than_30_days=self.items_older_than_30,
+            items_older_than_90_days=self.items_older_than_90,
+        )
+
+
 @dataclass
 class TriageAction:
     """An action taken during triage."""
@@ -97,42 +163,12 @@ class ReadingInbox:
         Returns:
             QueueStats with queue information.
         """
-        inbox = list(self._client.v3.get_inbox())
-        reading_list = list(self._client.v3.get_reading_list())
-
-        all_unread = inbox + reading_list
-        now = datetime.now(UTC)
-
-        # Calculate ages
-        ages_days = []
-        for doc in all_unread:
-            if doc.created_at:
-                age = (now - doc.created_at).days
-                ages_days.append(age)
-
-        oldest_age = max(ages_days) if ages_days else None
-        average_age = sum(ages_days) / len(ages_days) if ages_days else None
-
-        # Count by category
-        by_category: dict[str, int] = {}
-        for doc in all_unread:
-            cat = doc.category.value if doc.category else "unknown"
-            by_category[cat] = by_category.get(cat, 0) + 1
-
-        # Count old items
-        items_older_than_30 = sum(1 for age in ages_days if age > 30)
-        items_older_than_90 = sum(1 for age in ages_days if age > 90)
-
-        return QueueStats(
-            inbox_count=len(inbox),
-            reading_list_count=len(reading_list),
-            total_unread=len(all_unread),
-            oldest_item_age_days=oldest_age,
-            average_age_days=average_age,
-            by_category=by_category,
-            items_older_than_30_days=items_older_than_30,
-            items_older_than_90_days=items_older_than_90,
-        )
+        stats = _QueueStatsBuilder(datetime.now(UTC))
+        for doc in self._client.v3.get_inbox():
+            stats.add_inbox(doc)
+        for doc in self._client.v3.get_reading_list():
+            stats.add_reading_list(doc)
+        return stats.build()
 
     def smart_archive(
         self,
@@ -268,32 +304,21 @@ class ReadingInbox:
         Returns:
             Sorted list of inbox documents.
         """
-        inbox = list(self._client.v3.get_inbox())
+        now = datetime.now(UTC)
 
         def priority_key(doc: Document) -> tuple:
             # Category priority (lower is higher priority)
-            category_priority = {
-                DocumentCategory.ARTICLE: 0,
-                DocumentCategory.EMAIL: 1,
-                DocumentCategory.RSS: 2,
-                DocumentCategory.PDF: 3,
-                DocumentCategory.EPUB: 4,
-                DocumentCategory.TWEET: 5,
-                DocumentCategory.VIDEO: 6,
-            }
-            cat_pri = category_priority.get(doc.category, 99) if doc.category else 99
+            cat_pri = _CATEGORY_PRIORITY.get(doc.category, 99) if doc.category else 99
 
             # Age (newer is higher priority, so negative days)
-            age_days = 0
-            if doc.created_at:
-                age_days = (datetime.now(UTC) - doc.created_at).days
+            age_days = (now - doc.created_at).days if doc.created_at else 0
 
             # Title length as proxy for complexity (shorter is higher priority)
             title_len = len(doc.title) if doc.title else 0
 
             return (cat_pri, age_days, title_len)
 
-        return sorted(inbox, key=priority_key)
+        return sorted(self._client.v3.get_inbox(), key=priority_key)
 
     def search_inbox(
         self,
@@ -310,19 +335,12 @@ class ReadingInbox:
         Returns:
             List of matching documents.
         """
-        if not case_sensitive:
-            query = query.lower()
-
-        results = []
-        for doc in self._client.v3.get_inbox():
-            title = (doc.title or "") if case_sensitive else (doc.title or "").lower()
-            author = (doc.author or "") if case_sensitive else (doc.author or "").lower()
-            summary = (doc.summary or "") if case_sensitive else (doc.summary or "").lower()
-
-            if query in title or query in author or query in summary:
-                results.append(doc)
-
-        return results
+        matches = make_text_matcher(query, case_sensitive=case_sensitive)
+        return [
+            doc
+            for doc in self._client.v3.get_inbox()
+            if matches(doc.title) or matches(doc.author) or matches(doc.summary)
+        ]
 
     def get_inbox_categories(self) -> dict[DocumentCategory, list[Document]]:
         """Get inbox documents grouped by category.
@@ -334,9 +352,7 @@ class ReadingInbox:
 
         for doc in self._client.v3.get_inbox():
             if doc.category:
-                if doc.category not in groups:
-                    groups[doc.category] = []
-                groups[doc.category].append(doc)
+                groups.setdefault(doc.category, []).append(doc)
 
         return groups
 
@@ -365,21 +381,23 @@ def create_category_rule(category: DocumentCategory) -> ArchiveRule:
 
 def create_title_pattern_rule(pattern: str, name: str) -> ArchiveRule:
     """Create a rule to archive items matching a title pattern."""
+    matches = make_pattern_matcher(pattern)
 
     def condition(doc: Document) -> bool:
         if not doc.title:
             return False
-        return bool(re.search(pattern, doc.title, re.IGNORECASE))
+        return matches(doc.title)
 
     return ArchiveRule(name=name, condition=condition)
 
 
 def create_domain_rule(domain: str) -> ArchiveRule:
     """Create a rule to archive items from a specific domain."""
+    needle = domain.lower()
 
     def condition(doc: Document) -> bool:
         if not doc.url:
             return False
-        return domain.lower() in doc.url.lower()
+        return needle in doc.url.lower()
 
     return ArchiveRule(name=f"domain_{domain}", condition=condition)
@@ -2,16 +2,28 @@
 
 from __future__ import annotations
 
+import functools
 import re
 from collections import Counter
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
+from readwise_sdk._utils import make_pattern_matcher
 from readwise_sdk.v2.models import Highlight
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from readwise_sdk.client import ReadwiseClient
 
+_NON_ALNUM = re.compile(r"[^a-z0-9]")
+
+
+@functools.lru_cache(maxsize=256)
+def _build_matcher(pattern: str, case_sensitive: bool) -> Callable[[str | None], bool]:
+    """Build the text predicate for a TagPattern, cached per pattern and case mode."""
+    return make_pattern_matcher(pattern, case_sensitive=case_sensitive)
+
 
 @dataclass
 class TagPattern:
@@ -25,18 +37,10 @@ class TagPattern:
 
     def matches(self, highlight: Highlight) -> bool:
         """Check if a highlight matches this pattern."""
-        flags = 0 if self.case_sensitive else re.IGNORECASE
-
-        targets = []
-        if self.match_in_text:
-            targets.append(highlight.text)
-        if self.match_in_notes and highlight.note:
-            targets.append(highlight.note)
-
-        for target in targets:
-            if re.search(self.pattern, target, flags):
-                return True
-        return False
+        matcher = _build_matcher(self.pattern, self.case_sensitive)
+        if self.match_in_text and matcher(highlight.text):
+            return True
+        return bool(self.match_in_notes and highlight.note and matcher(highlight.note))
 
 
 @dataclass
@@ -144,35 +148,15 @@ class TagWorkflow:
 
     def _find_similar_tags(self, tags: list[str]) -> list[list[str]]:
         """Find tags that might be duplicates based on similarity."""
-        groups: list[list[str]] = []
-        processed: set[str] = set()
-
+        groups: dict[str, list[str]] = {}
         for tag in tags:
-            if tag in processed:
-                continue
-
-            similar = [tag]
-            normalized = self._normalize_tag(tag)
-
-            for other in tags:
-                if other == tag or other in processed:
-                    continue
-                if self._normalize_tag(other) == normalized:
-                    similar.append(other)
-
-            if len(similar) > 1:
-                groups.append(similar)
-                processed.update(similar)
-            else:
-                processed.add(tag)
-
-        return groups
+            groups.setdefault(self._normalize_tag(tag), []).append(tag)
+        return [similar for similar in groups.values() if len(similar) > 1]
 
     def _normalize_tag(self, tag: str) -> str:
         """Normalize a tag for comparison."""
         # Remove special characters, lowercase, strip whitespace
-        normalized = re.sub(r"[^a-z0-9]", "", tag.lower())
-        return normalized
+        return _NON_ALNUM.sub("", tag.lower())
 
     def merge_tags(
         self,
@@ -1,11 +1,13 @@
 """Tests for AsyncReadwiseClient."""
 
+import asyncio
+
 import httpx
 import pytest
 import respx
 
 from readwise_sdk import AsyncReadwiseClient
-from readwise_sdk.client import READWISE_API_V2_BASE
+from readwise_sdk.client import DEFAULT_LIMITS, READWISE_API_V2_BASE
 from readwise_sdk.exceptions import (
     AuthenticationError,
     NotFoundError,
@@ -53,6 +55,29 @@ class TestAsyncClientInit:
         assert client.max_retries == 5
         assert client.retry_backoff == 1.0
 
+    def test_default_limits(self, api_key: str) -> None:
+        """Test that the default connection pool limits are used."""
+        client = AsyncReadwiseClient(api_key=api_key)
+        assert client.limits == DEFAULT_LIMITS
+
+    def test_custom_limits(self, api_key: str, captured_httpx_kwargs: dict) -> None:
+        """Test that custom connection pool limits reach the HTTP client."""
+        limits = httpx.Limits(max_connections=500, max_keepalive_connections=50)
+        client = AsyncReadwiseClient(api_key=api_key, limits=limits)
+        _ = client.client
+
+        assert client.limits == limits
+        assert captured_httpx_kwargs["limits"] == limits
+        assert captured_httpx_kwargs["http2"] is False
+
+    def test_http2_opt_in(self, api_key: str, captured_httpx_kwargs: dict) -> None:
+        """Test that http2=True is passed through to the HTTP client."""
+        client = AsyncReadwiseClient.create_optional(api_key=api_key, http2=True)
+        _ = client.client
+
+        assert client.http2 is True
+        assert captured_httpx_kwargs["http2"] is True
+
 
 class TestAsyncClientContextManager:
     """Tests for async context manager."""
@@ -247,6 +272,117 @@ class TestAsyncPagination:
             assert len(items) == 2
             assert route.call_count == 2
 
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_fetch_all_pages_concurrent(self, api_key: str) -> None:
+        """Test that pages after the first are requested concurrently."""
+        url = f"{READWISE_API_V2_BASE}/items/"
+        in_flight = 0
+        max_in_flight = 0
+
+        async def page_response(request: httpx.Request) -> httpx.Response:
+            nonlocal in_flight, max_in_flight
+            page = int(request.url.params.get("page", "1"))
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return httpx.Response(
+                200,
+                json={
+                    "count": 10,
+                    "results": [{"id": page * 10 + 1}, {"id": page * 10 + 2}],
+                    "next": f"{url}?page={page + 1}" if page < 5 else None,
+                },
+            )
+
+        route = respx.get(url__startswith=url).mock(side_effect=page_response)
+
+        async with AsyncReadwiseClient(api_key=api_key) as client:
+            items = await client.fetch_all_pages(url, max_concurrency=3)
+
+        assert [item["id"] for item in items] == [11, 12, 21, 22, 31, 32, 41, 42, 51, 52]
+        assert route.call_count == 5
+        assert max_in_flight == 3
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_fetch_all_pages_stops_at_missing_page(self, api_key: str) -> None:
+        """Test that a page removed since the count was taken ends pagination."""
+        url = f"{READWISE_API_V2_BASE}/items/"
+        route = respx.get(url__startswith=url)
+        route.side_effect = [
+            httpx.Response(200, json={"count": 3, "results": [{"id": 1}], "next": f"{url}?page=2"}),
+            httpx.Response(200, json={"results": [{"id": 2}], "next": f"{url}?page=3"}),
+            httpx.Response(404, text="Invalid page."),
+        ]
+
+        async with AsyncReadwiseClient(api_key=api_key) as client:
+            items = await client.fetch_all_pages(url)
+
+        assert [item["id"] for item in items] == [1, 2]
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_fetch_all_pages_follows_next_past_count(self, api_key: str) -> None:
+        """Test that pages added after the count was taken are still fetched."""
+        url = f"{READWISE_API_V2_BASE}/items/"
+        route = respx.get(url__startswith=url)
+        route.side_effect = [
+            httpx.Response(200, json={"count": 2, "results": [{"id": 1}], "next": f"{url}?page=2"}),
+            httpx.Response(200, json={"count": 3, "results": [{"id": 2}], "next": f"{url}?page=3"}),
+            httpx.Response(200, json={"count": 3, "results": [{"id": 3}], "next": None}),
+        ]
+
+        async with AsyncReadwiseClient(api_key=api_key) as client:
+            items = await client.fetch_all_pages(url)
+
+        assert [item["id"] for item in items] == [1, 2, 3]
+        assert route.calls.last.request.url.params["page"] == "3"
+
+    @pytest.mark.asyncio
+    async def test_fetch_all_pages_rejects_zero_concurrency(self, api_key: str) -> None:
+        """Test that max_concurrency below 1 is rejected before any request."""
+        async with AsyncReadwiseClient(api_key=api_key) as client:
+            with pytest.raises(ValueError, match="max_concurrency"):
+                await client.fetch_all_pages(f"{READWISE_API_V2_BASE}/items/", max_concurrency=0)
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_fetch_all_pages_without_count(self, api_key: str) -> None:
+        """Test that endpoints without a count fall back to sequential pagination."""
+        url = f"{READWISE_API_V2_BASE}/items/"
+        route = respx.get(url__startswith=url)
+        route.side_effect = [
+            httpx.Response(200, json={"results": [{"id": 1}], "next": f"{url}?page=2"}),
+            httpx.Response(200, json={"results": [{"id": 2}], "next": None}),
+        ]
+
+        async with AsyncReadwiseClient(api_key=api_key) as client:
+            items = await client.fetch_all_pages(url)
+
+        assert [item["id"] for item in items] == [1, 2]
+        assert route.call_count == 2
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_count_results(self, api_key: str) -> None:
+        """Test that the envelope count is used, falling back to walking pages."""
+        url = f"{READWISE_API_V2_BASE}/items/"
+        route = respx.get(url__startswith=url)
+        route.side_effect = [
+            httpx.Response(200, json={"count": 250, "results": [{"id": 1}], "next": f"{url}?p=2"}),
+            httpx.Response(200, json={"results": [{"id": 1}], "next": f"{url}?page=2"}),
+            httpx.Response(200, json={"results": [{"id": 2}, {"id": 3}], "next": None}),
+        ]
+
+        async with AsyncReadwiseClient(api_key=api_key) as client:
+            assert await client.count_results(url) == 250
+            assert route.call_count == 1
+            assert await client.count_results(url) == 3
+
+        assert route.call_count == 3
+
 
 class TestAsyncRetry:
     """Tests for async retry logic."""
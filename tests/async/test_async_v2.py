@@ -86,6 +86,71 @@ class TestAsyncV2Highlights:
             assert "highlighted_at__gt=" in url_str
             assert "highlighted_at__lt=" in url_str
 
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_fetch_all_highlights(self, api_key: str) -> None:
+        """Test fetching every highlight page into model objects."""
+        url = f"{READWISE_API_V2_BASE}/highlights/"
+        route = respx.get(url).mock(
+            side_effect=[
+                httpx.Response(
+                    200,
+                    json={
+                        "count": 2,
+                        "results": [{"id": 1, "text": "First"}],
+                        "next": f"{url}?page=2",
+                    },
+                ),
+                httpx.Response(
+                    200, json={"count": 2, "results": [{"id": 2, "text": "Second"}], "next": None}
+                ),
+            ]
+        )
+
+        async with AsyncReadwiseClient(api_key=api_key) as client:
+            highlights = await client.v2.fetch_all_highlights(page_size=5000)
+
+        assert [h.id for h in highlights] == [1, 2]
+        assert route.calls[0].request.url.params["page_size"] == "1000"
+        assert route.calls[1].request.url.params["page"] == "2"
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_count_highlights(self, api_key: str) -> None:
+        """Test that counting requests a single-item page and reads its count."""
+        route = respx.get(f"{READWISE_API_V2_BASE}/highlights/").mock(
+            return_value=httpx.Response(200, json={"count": 42, "results": [], "next": None})
+        )
+
+        async with AsyncReadwiseClient(api_key=api_key) as client:
+            assert await client.v2.count_highlights() == 42
+
+        assert route.calls.last.request.url.params["page_size"] == "1"
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_count_highlights_without_count(self, api_key: str) -> None:
+        """Test that a missing count is walked at the normal page size, not one item a page."""
+        url = f"{READWISE_API_V2_BASE}/highlights/"
+
+        def respond(request: httpx.Request) -> httpx.Response:
+            page_size = int(request.url.params["page_size"])
+            page = int(request.url.params.get("page", 1))
+            total = 150
+            start = (page - 1) * page_size
+            results = [{"id": i, "text": "x"} for i in range(start, min(start + page_size, total))]
+            more = start + page_size < total
+            next_url = f"{url}?page={page + 1}&page_size={page_size}" if more else None
+            return httpx.Response(200, json={"results": results, "next": next_url})
+
+        route = respx.get(url).mock(side_effect=respond)
+
+        async with AsyncReadwiseClient(api_key=api_key) as client:
+            assert await client.v2.count_highlights() == 150
+
+        sizes = [call.request.url.params["page_size"] for call in route.calls]
+        assert sizes == ["1", "100", "100"]
+
     @respx.mock
     @pytest.mark.asyncio
     async def test_get_highlight(self, api_key: str) -> None:
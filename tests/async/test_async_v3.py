@@ -111,6 +111,21 @@ class TestAsyncV3Documents:
             assert "withHtmlContent=true" in str(request.url)
             assert len(docs) == 1
 
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_count_documents(self, api_key: str) -> None:
+        """Test counting documents in a location from the reported count."""
+        route = respx.get(f"{READWISE_API_V3_BASE}/list/").mock(
+            return_value=httpx.Response(
+                200, json={"count": 12, "results": [], "nextPageCursor": None}
+            )
+        )
+
+        async with AsyncReadwiseClient(api_key=api_key) as client:
+            assert await client.v3.count_documents(location=DocumentLocation.NEW) == 12
+
+        assert route.calls.last.request.url.params["location"] == "new"
+
     @respx.mock
     @pytest.mark.asyncio
     async def test_get_document(self, api_key: str) -> None:
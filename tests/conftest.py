@@ -1,8 +1,12 @@
 """Pytest configuration and fixtures."""
 
+import asyncio
 import os
+from collections.abc import Iterator
 from pathlib import Path
+from typing import Any
 
+import httpx
 import pytest
 
 collect_ignore: list[str] = []
@@ -30,3 +34,34 @@ def mock_env_api_key(api_key: str, monkeypatch: pytest.MonkeyPatch) -> str:
 def live_api_key() -> str | None:
     """Return the live API key from environment, or None if not set."""
     return os.environ.get("READWISE_API_KEY")
+
+
+@pytest.fixture
+def captured_httpx_kwargs(monkeypatch: pytest.MonkeyPatch) -> Iterator[dict[str, Any]]:
+    """Record the keyword arguments the SDK passes to httpx.Client/AsyncClient.
+
+    Real clients are still built, without HTTP/2 so the tests do not need the
+    h2 package, and are closed again at teardown.
+    """
+    captured: dict[str, Any] = {}
+    built: list[httpx.Client | httpx.AsyncClient] = []
+    real_async_client = httpx.AsyncClient
+
+    def recording(real: type) -> Any:
+        def build(**kwargs: Any) -> Any:
+            captured.update(kwargs)
+            client = real(**{**kwargs, "http2": False})
+            built.append(client)
+            return client
+
+        return build
+
+    monkeypatch.setattr(httpx, "Client", recording(httpx.Client))
+    monkeypatch.setattr(httpx, "AsyncClient", recording(real_async_client))
+    yield captured
+
+    for client in built:
+        if isinstance(client, real_async_client):
+            asyncio.run(client.aclose())
+        else:
+            client.close()
@@ -1,6 +1,8 @@
 """Tests for async manager classes."""
 
+import asyncio
 import json
+from collections.abc import Iterator
 from datetime import UTC, datetime
 
 import httpx
@@ -24,29 +26,49 @@ V3_LIST = f"{READWISE_API_V3_BASE}/list/"
 V3_UPDATE = f"{READWISE_API_V3_BASE}/update/"
 
 
+_JSON_HEADERS = {"content-type": "application/json"}
+_EMPTY_V2_PAGE = json.dumps({"next": None, "results": []}).encode()
+_EMPTY_V3_PAGE = json.dumps({"nextPageCursor": None, "results": []}).encode()
+
+
+def _json_response(body: bytes) -> httpx.Response:
+    return httpx.Response(200, content=body, headers=_JSON_HEADERS)
+
+
 def _mock_v2_highlights(results: list[dict]) -> None:
-    respx.get(V2_HIGHLIGHTS).mock(
-        return_value=httpx.Response(200, json={"next": None, "results": results})
-    )
+    body = json.dumps({"next": None, "results": results}).encode()
+    respx.get(V2_HIGHLIGHTS).mock(return_value=_json_response(body))
 
 
 def _mock_v2_books(results: list[dict]) -> None:
-    respx.get(V2_BOOKS).mock(
-        return_value=httpx.Response(200, json={"next": None, "results": results})
-    )
+    body = json.dumps({"next": None, "results": results}).encode()
+    respx.get(V2_BOOKS).mock(return_value=_json_response(body))
 
 
 def _mock_v3_list(results: list[dict]) -> None:
-    respx.get(V3_LIST).mock(
-        return_value=httpx.Response(200, json={"nextPageCursor": None, "results": results})
-    )
+    body = json.dumps({"nextPageCursor": None, "results": results}).encode()
+    respx.get(V3_LIST).mock(return_value=_json_response(body))
+
+
+def _request_json(route: respx.Route) -> dict:
+    """Decode the JSON body of the last request recorded by a route."""
+    return json.loads(route.calls.last.request.content)
 
 
 def _mock_empty_sync_responses() -> None:
     """Mock all three sync endpoints with empty results."""
-    _mock_v2_highlights([])
-    _mock_v2_books([])
-    _mock_v3_list([])
+    respx.get(V2_HIGHLIGHTS).mock(return_value=_json_response(_EMPTY_V2_PAGE))
+    respx.get(V2_BOOKS).mock(return_value=_json_response(_EMPTY_V2_PAGE))
+    respx.get(V3_LIST).mock(return_value=_json_response(_EMPTY_V3_PAGE))
+
+
+@pytest.fixture
+def doc1_update_route() -> Iterator[respx.Route]:
+    """Mock the v3 update endpoint for ``doc1`` for the duration of a test."""
+    with respx.mock:
+        yield respx.patch(f"{V3_UPDATE}doc1/").mock(
+            return_value=httpx.Response(200, json={"id": "doc1", "url": "https://example.com/1"})
+        )
 
 
 class TestAsyncHighlightManager:
@@ -65,6 +87,53 @@ class TestAsyncHighlightManager:
         assert highlights[0].id == 1
         assert highlights[1].id == 2
 
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_get_all_highlights_multi_page(self, api_key: str) -> None:
+        """Test that all pages are fetched and returned in page order."""
+
+        def page_response(request: httpx.Request) -> httpx.Response:
+            page = int(request.url.params.get("page", "1"))
+            return httpx.Response(
+                200,
+                json={
+                    "count": 5,
+                    "results": [{"id": page, "text": f"Page {page}"}],
+                    "next": f"{V2_HIGHLIGHTS}?page={page + 1}" if page < 5 else None,
+                },
+            )
+
+        route = respx.get(V2_HIGHLIGHTS).mock(side_effect=page_response)
+
+        async with AsyncReadwiseClient(api_key=api_key) as client:
+            highlights = await AsyncHighlightManager(client).get_all_highlights()
+
+        assert [h.id for h in highlights] == [1, 2, 3, 4, 5]
+        assert route.call_count == 5
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_get_all_highlights_parses_fields(self, api_key: str) -> None:
+        """Test that highlights are fully validated, not constructed from raw dicts."""
+        _mock_v2_highlights(
+            [
+                {
+                    "id": 1,
+                    "text": "First",
+                    "color": "not-a-color",
+                    "updated_at": "2024-06-01T00:00:00Z",
+                    "tags": [{"id": 10, "name": "python"}],
+                }
+            ]
+        )
+
+        async with AsyncReadwiseClient(api_key=api_key) as client:
+            highlights = await AsyncHighlightManager(client).get_all_highlights()
+
+        assert highlights[0].color is None
+        assert highlights[0].updated_at == datetime(2024, 6, 1, tzinfo=UTC)
+        assert highlights[0].tags[0].name == "python"
+
     @pytest.mark.asyncio
     @respx.mock
     @pytest.mark.parametrize(
@@ -524,7 +593,6 @@ class TestAsyncDocumentManager:
                 await AsyncDocumentManager(client).get_documents_since()
 
     @pytest.mark.asyncio
-    @respx.mock
     @pytest.mark.parametrize(
         ("method", "expected_location"),
         [
@@ -532,22 +600,22 @@ class TestAsyncDocumentManager:
             ("archive", "archive"),
             ("move_to_inbox", "new"),
         ],
+        ids=["later", "archive", "inbox"],
     )
     async def test_document_move_operations(
-        self, api_key: str, method: str, expected_location: str
+        self,
+        api_key: str,
+        doc1_update_route: respx.Route,
+        method: str,
+        expected_location: str,
     ) -> None:
         """Test moving a document to different locations."""
-        route = respx.patch(f"{V3_UPDATE}doc1/").mock(
-            return_value=httpx.Response(200, json={"id": "doc1", "url": "https://example.com/1"})
-        )
-
         async with AsyncReadwiseClient(api_key=api_key) as client:
             manager = AsyncDocumentManager(client)
             await getattr(manager, method)("doc1")
 
-        assert route.called
-        body = json.loads(route.calls[0].request.content)
-        assert body["location"] == expected_location
+        assert doc1_update_route.call_count == 1
+        assert _request_json(doc1_update_route)["location"] == expected_location
 
     @pytest.mark.asyncio
     @respx.mock
@@ -576,6 +644,48 @@ class TestAsyncDocumentManager:
 
         assert results == {"doc1": False, "doc2": False}
 
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_bulk_archive_concurrent(self, api_key: str) -> None:
+        """Test that bulk requests overlap, bounded by max_concurrency."""
+        in_flight = 0
+        max_in_flight = 0
+
+        async def update_response(request: httpx.Request) -> httpx.Response:
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            if request.url.path.endswith("/doc3/"):
+                return httpx.Response(500)
+            return httpx.Response(200, json={"id": "doc", "url": "https://example.com"})
+
+        route = respx.patch(url__startswith=V3_UPDATE).mock(side_effect=update_response)
+        doc_ids = [f"doc{i}" for i in range(1, 7)]
+
+        async with AsyncReadwiseClient(api_key=api_key, max_retries=0) as client:
+            results = await AsyncDocumentManager(client).bulk_archive(doc_ids, max_concurrency=3)
+
+        assert list(results) == doc_ids
+        assert [doc_id for doc_id, ok in results.items() if not ok] == ["doc3"]
+        assert route.call_count == 6
+        assert max_in_flight == 3
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("method", "args"),
+        [("bulk_archive", (["doc1"],)), ("bulk_tag_documents", (["doc1"], ["tag1"]))],
+    )
+    async def test_bulk_rejects_zero_concurrency(
+        self, api_key: str, method: str, args: tuple
+    ) -> None:
+        """Test that max_concurrency below 1 raises instead of hanging on the semaphore."""
+        async with AsyncReadwiseClient(api_key=api_key) as client:
+            manager = AsyncDocumentManager(client)
+            with pytest.raises(ValueError, match="max_concurrency"):
+                await asyncio.wait_for(getattr(manager, method)(*args, max_concurrency=0), 1)
+
     @pytest.mark.asyncio
     @respx.mock
     async def test_bulk_tag_documents(self, api_key: str) -> None:
@@ -653,17 +763,45 @@ class TestAsyncDocumentManager:
         assert results[0].title is not None
         assert "Python" in results[0].title
 
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_search_documents_casefolds(self, api_key: str) -> None:
+        """Test that case-insensitive search folds the query and fields."""
+        _mock_v3_list(
+            [
+                {"id": "doc1", "url": "https://example.com/1", "title": "Hauptstraße"},
+                {"id": "doc2", "url": "https://example.com/2", "title": "Marktplatz"},
+            ]
+        )
+
+        async with AsyncReadwiseClient(api_key=api_key) as client:
+            results = await AsyncDocumentManager(client).search_documents("STRASSE")
+
+        assert [d.id for d in results] == ["doc1"]
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_search_documents_pushes_filters_to_api(self, api_key: str) -> None:
+        """Test that category and tag filters are sent as query params."""
+        route = respx.get(V3_LIST).mock(return_value=_json_response(_EMPTY_V3_PAGE))
+
+        async with AsyncReadwiseClient(api_key=api_key) as client:
+            await AsyncDocumentManager(client).search_documents(
+                "python", category=DocumentCategory.PDF, tag="programming"
+            )
+
+        params = route.calls.last.request.url.params
+        assert params["category"] == "pdf"
+        assert params["tag"] == "programming"
+
     @pytest.mark.asyncio
     @respx.mock
     async def test_get_inbox_stats(self, api_key: str) -> None:
         """Test getting inbox statistics."""
-        call_count = 0
-
-        def mock_response(request: httpx.Request) -> httpx.Response:
-            nonlocal call_count
-            call_count += 1
-            if call_count == 1:
-                return httpx.Response(
+        # Inbox, reading list and archive are fetched in that order.
+        respx.get(V3_LIST).mock(
+            side_effect=[
+                httpx.Response(
                     200,
                     json={
                         "results": [
@@ -682,19 +820,17 @@ class TestAsyncDocumentManager:
                         ],
                         "nextPageCursor": None,
                     },
-                )
-            elif call_count == 2:
-                return httpx.Response(
+                ),
+                httpx.Response(
                     200,
                     json={
                         "results": [{"id": "doc3", "url": "https://c.com", "category": "article"}],
                         "nextPageCursor": None,
                     },
-                )
-            else:
-                return httpx.Response(200, json={"results": [], "nextPageCursor": None})
-
-        respx.get(V3_LIST).mock(side_effect=mock_response)
+                ),
+                _json_response(_EMPTY_V3_PAGE),
+            ]
+        )
 
         async with AsyncReadwiseClient(api_key=api_key) as client:
             stats = await AsyncDocumentManager(client).get_inbox_stats()
@@ -737,13 +873,10 @@ class TestAsyncDocumentManager:
     @respx.mock
     async def test_get_unread_count(self, api_key: str) -> None:
         """Test getting unread document count."""
-        call_count = 0
-
-        def mock_response(request: httpx.Request) -> httpx.Response:
-            nonlocal call_count
-            call_count += 1
-            if call_count == 1:
-                return httpx.Response(
+        # Inbox and reading list are fetched in that order.
+        respx.get(V3_LIST).mock(
+            side_effect=[
+                httpx.Response(
                     200,
                     json={
                         "results": [
@@ -752,17 +885,16 @@ class TestAsyncDocumentManager:
                         ],
                         "nextPageCursor": None,
                     },
-                )
-            else:
-                return httpx.Response(
+                ),
+                httpx.Response(
                     200,
                     json={
                         "results": [{"id": "doc3", "url": "https://c.com"}],
                         "nextPageCursor": None,
                     },
-                )
-
-        respx.get(V3_LIST).mock(side_effect=mock_response)
+                ),
+            ]
+        )
 
         async with AsyncReadwiseClient(api_key=api_key) as client:
             count = await AsyncDocumentManager(client).get_unread_count()
@@ -116,6 +116,29 @@ class TestBookManager:
         assert stats.books_by_category["books"] == 1
         assert stats.books_by_category["articles"] == 1
         assert stats.highlights_by_source["kindle"] == 10
+        assert stats.most_highlighted_books == [("Book 1", 10), ("Article 1", 5)]
+
+    @respx.mock
+    def test_get_recent_books(self, api_key: str) -> None:
+        """Test that recent books are newest first, undated last, and limited."""
+        respx.get(f"{READWISE_API_V2_BASE}/books/").mock(
+            return_value=httpx.Response(
+                200,
+                json={
+                    "results": [
+                        {"id": 1, "title": "Undated"},
+                        {"id": 2, "title": "Old", "last_highlight_at": "2024-06-01T00:00:00Z"},
+                        {"id": 3, "title": "New", "last_highlight_at": "2024-06-15T00:00:00Z"},
+                    ],
+                    "next": None,
+                },
+            )
+        )
+
+        manager = BookManager(ReadwiseClient(api_key=api_key))
+
+        assert [b.title for b in manager.get_recent_books()] == ["New", "Old", "Undated"]
+        assert [b.title for b in manager.get_recent_books(limit=2)] == ["New", "Old"]
 
     @respx.mock
     def test_search_books(self, api_key: str) -> None:
@@ -87,6 +87,21 @@ class TestDocumentManager:
         assert results[0].title is not None
         assert "Python" in results[0].title
 
+    @respx.mock
+    def test_search_documents_pushes_filters_to_api(self, api_key: str) -> None:
+        """Test that category and tag filters are sent as query params."""
+        route = respx.get(V3_LIST).mock(
+            return_value=httpx.Response(200, json={"results": [], "nextPageCursor": None})
+        )
+
+        _make_manager(api_key).search_documents(
+            "python", category=DocumentCategory.PDF, tag="programming"
+        )
+
+        params = route.calls.last.request.url.params
+        assert params["category"] == "pdf"
+        assert params["tag"] == "programming"
+
     @respx.mock
     def test_get_inbox_stats(self, api_key: str) -> None:
         """Test getting inbox statistics."""
@@ -135,6 +150,46 @@ class TestDocumentManager:
         assert stats.reading_list_count == 1
         assert stats.by_category["article"] == 3
 
+    @respx.mock
+    def test_get_inbox_stats_oldest_newest(self, api_key: str) -> None:
+        """Test that undated inbox items count as oldest and archive pages are tallied."""
+
+        def page(results: list[dict], cursor: str | None = None) -> httpx.Response:
+            return httpx.Response(200, json={"results": results, "nextPageCursor": cursor})
+
+        respx.get(V3_LIST).mock(
+            side_effect=[
+                page(
+                    [
+                        {
+                            "id": "doc1",
+                            "url": "https://a.com",
+                            "created_at": "2024-01-15T00:00:00Z",
+                        },
+                        {"id": "doc2", "url": "https://b.com"},
+                    ],
+                    cursor="next",
+                ),
+                page(
+                    [{"id": "doc3", "url": "https://c.com", "created_at": "2024-01-10T00:00:00Z"}]
+                ),
+                page([]),
+                page([{"id": "doc4", "url": "https://d.com"}], cursor="next"),
+                page([{"id": "doc5", "url": "https://e.com"}]),
+            ]
+        )
+
+        stats = _make_manager(api_key).get_inbox_stats()
+
+        assert stats.inbox_count == 3
+        assert stats.archive_count == 2
+        assert stats.total_count == 5
+        assert stats.by_category == {"unknown": 3}
+        assert stats.oldest_inbox_item is not None
+        assert stats.oldest_inbox_item.id == "doc2"
+        assert stats.newest_inbox_item is not None
+        assert stats.newest_inbox_item.id == "doc1"
+
     @respx.mock
     def test_get_documents_by_category(self, api_key: str) -> None:
         """Test getting documents by category."""
@@ -257,6 +312,24 @@ class TestDocumentManager:
         assert len(results) == 1
         assert results[0].id == "doc2"
 
+    @respx.mock
+    def test_filter_documents_is_lazy(self, api_key: str) -> None:
+        """Test that stopping at the first match does not fetch further pages."""
+        route = respx.get(V3_LIST).mock(
+            return_value=httpx.Response(
+                200,
+                json={
+                    "results": [{"id": "doc1", "url": "https://a.com", "title": "Match"}],
+                    "nextPageCursor": "next",
+                },
+            )
+        )
+
+        first = next(_make_manager(api_key).filter_documents(lambda d: d.title == "Match"))
+
+        assert first.id == "doc1"
+        assert route.call_count == 1
+
     @respx.mock
     def test_get_unread_count(self, api_key: str) -> None:
         """Test getting unread document count."""
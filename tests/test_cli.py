@@ -8,13 +8,16 @@ from typing import Any
 import httpx
 import pytest
 import respx
-from typer.testing import CliRunner
+from click.testing import CliRunner
+from typer.main import get_command
 
 from readwise_sdk.cli.main import app, get_client
 from readwise_sdk.client import READWISE_API_V2_BASE, READWISE_API_V3_BASE
 from readwise_sdk.v2.models import Tag
 
 runner = CliRunner()
+# Build the Click command tree once; typer's CliRunner rebuilds it on every invoke.
+cli = get_command(app)
 
 
 # ---------------------------------------------------------------------------
@@ -40,10 +43,10 @@ def _extract_json(output: str) -> Any:
     before the actual JSON payload.  This helper locates the first '{' or '['
     and parses from there.
     """
-    for i, ch in enumerate(output):
-        if ch in ("{", "["):
-            return json.loads(output[i:])
-    raise ValueError(f"No JSON found in output: {output!r}")
+    starts = [i for i in (output.find("{"), output.find("[")) if i >= 0]
+    if not starts:
+        raise ValueError(f"No JSON found in output: {output!r}")
+    return json.loads(output[min(starts) :])
 
 
 def _highlight(
@@ -158,7 +161,7 @@ class TestVersionCommand:
 
     def test_version(self) -> None:
         """version command prints version info."""
-        result = runner.invoke(app, ["version"])
+        result = runner.invoke(cli, ["version"])
         assert result.exit_code == 0
         assert "readwise-plus" in result.output
 
@@ -180,7 +183,7 @@ class TestHighlightsListCommand:
                 _highlight(id=2, text="Highlight two"),
             ]
         )
-        result = runner.invoke(app, ["highlights", "list"])
+        result = runner.invoke(cli, ["highlights", "list"])
         assert result.exit_code == 0
         assert "Highlight one" in result.output
         assert "Highlight two" in result.output
@@ -189,7 +192,7 @@ class TestHighlightsListCommand:
     def test_list_highlights_json(self) -> None:
         """highlights list --json outputs JSON."""
         _mock_v2_highlights([_highlight(id=10, text="Short text", note="A note")])
-        result = runner.invoke(app, ["highlights", "list", "--json"])
+        result = runner.invoke(cli, ["highlights", "list", "--json"])
         assert result.exit_code == 0
         data = json.loads(result.output)
         assert isinstance(data, list)
@@ -200,7 +203,7 @@ class TestHighlightsListCommand:
     def test_list_highlights_limit(self) -> None:
         """highlights list --limit respects the limit option."""
         _mock_v2_highlights([_highlight(id=i, text=f"H{i}") for i in range(5)])
-        result = runner.invoke(app, ["highlights", "list", "--limit", "2", "--json"])
+        result = runner.invoke(cli, ["highlights", "list", "--limit", "2", "--json"])
         assert result.exit_code == 0
         data = json.loads(result.output)
         assert len(data) == 2
@@ -210,7 +213,7 @@ class TestHighlightsListCommand:
         """Long highlight texts are truncated in JSON output."""
         long_text = "A" * 200
         _mock_v2_highlights([_highlight(id=1, text=long_text)])
-        result = runner.invoke(app, ["highlights", "list", "--json"])
+        result = runner.invoke(cli, ["highlights", "list", "--json"])
         assert result.exit_code == 0
         assert "..." in result.output
         assert long_text not in result.output
@@ -219,14 +222,14 @@ class TestHighlightsListCommand:
     def test_list_highlights_empty(self) -> None:
         """highlights list handles empty response."""
         _mock_v2_highlights([])
-        result = runner.invoke(app, ["highlights", "list"])
+        result = runner.invoke(cli, ["highlights", "list"])
         assert result.exit_code == 0
         assert "0 shown" in result.output
 
     def test_list_highlights_no_api_key(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """highlights list fails when API key is missing."""
         monkeypatch.delenv("READWISE_API_KEY", raising=False)
-        result = runner.invoke(app, ["highlights", "list"])
+        result = runner.invoke(cli, ["highlights", "list"])
         assert result.exit_code != 0
 
 
@@ -249,7 +252,7 @@ class TestHighlightsShowCommand:
                 ),
             )
         )
-        result = runner.invoke(app, ["highlights", "show", "42"])
+        result = runner.invoke(cli, ["highlights", "show", "42"])
         assert result.exit_code == 0
         for expected in ("42", "Great insight", "My note", "15", "favorite"):
             assert expected in result.output
@@ -260,7 +263,7 @@ class TestHighlightsShowCommand:
         respx.get(f"{READWISE_API_V2_BASE}/highlights/99999/").mock(
             return_value=httpx.Response(404, text="Not found")
         )
-        result = runner.invoke(app, ["highlights", "show", "99999"])
+        result = runner.invoke(cli, ["highlights", "show", "99999"])
         assert result.exit_code != 0
 
     @respx.mock
@@ -269,7 +272,7 @@ class TestHighlightsShowCommand:
         respx.get(f"{READWISE_API_V2_BASE}/highlights/1/").mock(
             return_value=httpx.Response(200, json=_highlight(id=1, text="Minimal highlight"))
         )
-        result = runner.invoke(app, ["highlights", "show", "1"])
+        result = runner.invoke(cli, ["highlights", "show", "1"])
         assert result.exit_code == 0
         assert "Minimal highlight" in result.output
 
@@ -289,7 +292,7 @@ class TestHighlightsExportCommand:
     def test_export_highlights(self, extra_args: list[str], expected_in_output: str) -> None:
         """highlights export outputs in the requested format."""
         _mock_v2_highlights([_highlight(id=1, text=expected_in_output)])
-        result = runner.invoke(app, ["highlights", "export", *extra_args])
+        result = runner.invoke(cli, ["highlights", "export", *extra_args])
         assert result.exit_code == 0
         assert expected_in_output in result.output
 
@@ -298,7 +301,7 @@ class TestHighlightsExportCommand:
         """highlights export -o writes to a file."""
         _mock_v2_highlights([_highlight(id=1, text="File export")])
         outfile = tmp_path / "export.md"
-        result = runner.invoke(app, ["highlights", "export", "-o", str(outfile)])
+        result = runner.invoke(cli, ["highlights", "export", "-o", str(outfile)])
         assert result.exit_code == 0
         assert "Exported to" in result.output
         assert outfile.exists()
@@ -306,7 +309,7 @@ class TestHighlightsExportCommand:
 
     def test_export_highlights_invalid_format(self) -> None:
         """highlights export fails with an invalid format."""
-        result = runner.invoke(app, ["highlights", "export", "--format", "invalid_format"])
+        result = runner.invoke(cli, ["highlights", "export", "--format", "invalid_format"])
         assert result.exit_code != 0
 
 
@@ -327,7 +330,7 @@ class TestBooksListCommand:
                 _book(id=2, title="Book Two", author="Author Two", num_highlights=3),
             ]
         )
-        result = runner.invoke(app, ["books", "list"])
+        result = runner.invoke(cli, ["books", "list"])
         assert result.exit_code == 0
         assert "Book One" in result.output
         assert "Book Two" in result.output
@@ -336,7 +339,7 @@ class TestBooksListCommand:
     def test_list_books_json(self) -> None:
         """books list --json outputs JSON."""
         _mock_v2_books([_book(id=5, title="My Book", author="Jane", num_highlights=7)])
-        result = runner.invoke(app, ["books", "list", "--json"])
+        result = runner.invoke(cli, ["books", "list", "--json"])
         assert result.exit_code == 0
         data = json.loads(result.output)
         assert isinstance(data, list)
@@ -347,21 +350,21 @@ class TestBooksListCommand:
     def test_list_books_with_category(self) -> None:
         """books list --category filters by category."""
         route = _mock_v2_books([])
-        result = runner.invoke(app, ["books", "list", "--category", "articles"])
+        result = runner.invoke(cli, ["books", "list", "--category", "articles"])
         assert result.exit_code == 0
         assert route.called
         assert "category=articles" in str(route.calls.last.request.url)
 
     def test_list_books_invalid_category(self) -> None:
         """books list fails with an invalid category."""
-        result = runner.invoke(app, ["books", "list", "--category", "not_a_category"])
+        result = runner.invoke(cli, ["books", "list", "--category", "not_a_category"])
         assert result.exit_code != 0
 
     @respx.mock
     def test_list_books_empty(self) -> None:
         """books list handles empty response."""
         _mock_v2_books([])
-        result = runner.invoke(app, ["books", "list"])
+        result = runner.invoke(cli, ["books", "list"])
         assert result.exit_code == 0
         assert "0 shown" in result.output
 
@@ -370,7 +373,7 @@ class TestBooksListCommand:
         """Long book titles are truncated in table output."""
         long_title = "A" * 50
         _mock_v2_books([_book(id=1, title=long_title, author="B" * 25)])
-        result = runner.invoke(app, ["books", "list"])
+        result = runner.invoke(cli, ["books", "list"])
         assert result.exit_code == 0
         assert "..." in result.output
         assert long_title not in result.output
@@ -401,7 +404,7 @@ class TestBooksShowCommand:
                 _highlight(id=2, text="Highlight B"),
             ]
         )
-        result = runner.invoke(app, ["books", "show", "10"])
+        result = runner.invoke(cli, ["books", "show", "10"])
         assert result.exit_code == 0
         for expected in ("Great Book", "John", "books", "kindle", "Highlight A"):
             assert expected in result.output
@@ -412,7 +415,7 @@ class TestBooksShowCommand:
         respx.get(f"{READWISE_API_V2_BASE}/books/99999/").mock(
             return_value=httpx.Response(404, text="Not found")
         )
-        result = runner.invoke(app, ["books", "show", "99999"])
+        result = runner.invoke(cli, ["books", "show", "99999"])
         assert result.exit_code != 0
 
     @respx.mock
@@ -422,7 +425,7 @@ class TestBooksShowCommand:
             return_value=httpx.Response(200, json=_book(id=5, title="Empty Book", num_highlights=0))
         )
         _mock_v2_highlights([])
-        result = runner.invoke(app, ["books", "show", "5"])
+        result = runner.invoke(cli, ["books", "show", "5"])
         assert result.exit_code == 0
         assert "Empty Book" in result.output
 
@@ -444,7 +447,7 @@ class TestReaderInboxCommand:
                 _document(id="d2", title="Article Two", category="email"),
             ]
         )
-        result = runner.invoke(app, ["reader", "inbox"])
+        result = runner.invoke(cli, ["reader", "inbox"])
         assert result.exit_code == 0
         assert "Article One" in result.output
         assert "Article Two" in result.output
@@ -457,7 +460,7 @@ class TestReaderInboxCommand:
                 _document(id="abc123", title="Test Doc", category="article"),
             ]
         )
-        result = runner.invoke(app, ["reader", "inbox", "--json"])
+        result = runner.invoke(cli, ["reader", "inbox", "--json"])
         assert result.exit_code == 0
         data = json.loads(result.output)
         assert isinstance(data, list)
@@ -468,7 +471,7 @@ class TestReaderInboxCommand:
     def test_reader_inbox_limit(self) -> None:
         """reader inbox --limit respects the limit option."""
         _mock_v3_documents([_document(id=f"d{i}", title=f"Doc {i}") for i in range(5)])
-        result = runner.invoke(app, ["reader", "inbox", "--limit", "3", "--json"])
+        result = runner.invoke(cli, ["reader", "inbox", "--limit", "3", "--json"])
         assert result.exit_code == 0
         data = json.loads(result.output)
         assert len(data) == 3
@@ -477,7 +480,7 @@ class TestReaderInboxCommand:
     def test_reader_inbox_empty(self) -> None:
         """reader inbox handles empty response."""
         _mock_v3_documents([])
-        result = runner.invoke(app, ["reader", "inbox"])
+        result = runner.invoke(cli, ["reader", "inbox"])
         assert result.exit_code == 0
         assert "0 shown" in result.output
 
@@ -493,7 +496,7 @@ class TestReaderSaveCommand:
                 200, json={"id": "new-doc-id", "url": "https://example.com/saved"}
             )
         )
-        result = runner.invoke(app, ["reader", "save", "https://example.com/saved"])
+        result = runner.invoke(cli, ["reader", "save", "https://example.com/saved"])
         assert result.exit_code == 0
         assert "Saved" in result.output
         assert "new-doc-id" in result.output
@@ -504,7 +507,7 @@ class TestReaderSaveCommand:
         respx.post(f"{READWISE_API_V3_BASE}/save/").mock(
             return_value=httpx.Response(500, text="Internal Server Error")
         )
-        result = runner.invoke(app, ["reader", "save", "https://example.com/fail"])
+        result = runner.invoke(cli, ["reader", "save", "https://example.com/fail"])
         assert result.exit_code != 0
 
 
@@ -519,7 +522,7 @@ class TestReaderArchiveCommand:
                 200, json={"id": "doc-to-archive", "url": "https://example.com"}
             )
         )
-        result = runner.invoke(app, ["reader", "archive", "doc-to-archive"])
+        result = runner.invoke(cli, ["reader", "archive", "doc-to-archive"])
         assert result.exit_code == 0
         assert "Archived" in result.output
 
@@ -529,7 +532,7 @@ class TestReaderArchiveCommand:
         respx.patch(url__startswith=f"{READWISE_API_V3_BASE}/update/").mock(
             return_value=httpx.Response(404, text="Not found")
         )
-        result = runner.invoke(app, ["reader", "archive", "nonexistent"])
+        result = runner.invoke(cli, ["reader", "archive", "nonexistent"])
         assert result.exit_code != 0
 
 
@@ -539,27 +542,17 @@ class TestReaderStatsCommand:
     @respx.mock
     def test_reader_stats(self) -> None:
         """reader stats displays queue statistics."""
-        respx.get(f"{READWISE_API_V3_BASE}/list/").mock(
-            side_effect=lambda request: httpx.Response(
-                200,
-                json={
-                    "results": [
-                        _document(id=f"inbox-{i}", title=f"Inbox {i}", category="article")
-                        for i in range(3)
-                    ],
-                    "nextPageCursor": None,
-                }
-                if "location=new" in str(request.url)
-                else {
-                    "results": [
-                        _document(id=f"later-{i}", title=f"Later {i}", category="email")
-                        for i in range(2)
-                    ],
-                    "nextPageCursor": None,
-                },
+        inbox = [
+            _document(id=f"inbox-{i}", title=f"Inbox {i}", category="article") for i in range(3)
+        ]
+        later = [_document(id=f"later-{i}", title=f"Later {i}", category="email") for i in range(2)]
+        for location, documents in (("new", inbox), ("later", later)):
+            respx.get(f"{READWISE_API_V3_BASE}/list/", params={"location": location}).mock(
+                return_value=httpx.Response(
+                    200, json={"results": documents, "nextPageCursor": None}
+                )
             )
-        )
-        result = runner.invoke(app, ["reader", "stats"])
+        result = runner.invoke(cli, ["reader", "stats"])
         assert result.exit_code == 0
         for expected in ("3", "2", "5", "article", "email"):
             assert expected in result.output
@@ -568,7 +561,7 @@ class TestReaderStatsCommand:
     def test_reader_stats_empty(self) -> None:
         """reader stats handles empty inbox and reading list (no age display)."""
         _mock_v3_documents([])
-        result = runner.invoke(app, ["reader", "stats"])
+        result = runner.invoke(cli, ["reader", "stats"])
         assert result.exit_code == 0
         assert "Oldest Item" not in result.output
         assert "Average Age" not in result.output
@@ -594,7 +587,7 @@ class TestSyncCommands:
         _mock_v2_books([_book(id=1, title="B1")])
         _mock_v3_documents([])
 
-        result = runner.invoke(app, ["sync", "full"])
+        result = runner.invoke(cli, ["sync", "full"])
         assert result.exit_code == 0
         assert "Sync complete" in result.output
         assert "Highlights: 2" in result.output
@@ -608,7 +601,7 @@ class TestSyncCommands:
         _mock_v2_books([])
         _mock_v3_documents([_document(id="d1", url="https://example.com")])
 
-        result = runner.invoke(app, ["sync", "incremental"])
+        result = runner.invoke(cli, ["sync", "incremental"])
         assert result.exit_code == 0
         assert "Sync complete" in result.output
         assert "New highlights: 1" in result.output
@@ -624,7 +617,7 @@ class TestSyncCommands:
             _mock_v2_highlights([])
             _mock_v2_books([])
             _mock_v3_documents([])
-            result = runner.invoke(app, ["sync", "incremental", "--state-file", str(state_file)])
+            result = runner.invoke(cli, ["sync", "incremental", "--state-file", str(state_file)])
 
         assert result.exit_code == 0
         assert state_file.exists()
@@ -652,7 +645,7 @@ class TestDigestCommands:
     def test_digest_default_output(self, subcommand: list[str], expected_title: str) -> None:
         """digest daily/weekly outputs a digest with the correct title."""
         _mock_v2_highlights([_highlight(id=1, text="Digest highlight")])
-        result = runner.invoke(app, ["digest", *subcommand])
+        result = runner.invoke(cli, ["digest", *subcommand])
         assert result.exit_code == 0
         assert expected_title in result.output
         assert "Digest highlight" in result.output
@@ -661,7 +654,7 @@ class TestDigestCommands:
     def test_digest_daily_json_format(self) -> None:
         """digest daily --format json outputs JSON digest."""
         _mock_v2_highlights([_highlight(id=1, text="JSON highlight")])
-        result = runner.invoke(app, ["digest", "daily", "--format", "json"])
+        result = runner.invoke(cli, ["digest", "daily", "--format", "json"])
         assert result.exit_code == 0
         data = _extract_json(result.output)
         assert data["title"] == "Daily Digest"
@@ -686,7 +679,7 @@ class TestDigestCommands:
         """digest daily/weekly -o writes to a file."""
         _mock_v2_highlights([_highlight(id=1, text="File content")])
         outfile = tmp_path / "digest.md"
-        result = runner.invoke(app, ["digest", *subcommand, "-o", str(outfile)])
+        result = runner.invoke(cli, ["digest", *subcommand, "-o", str(outfile)])
         assert result.exit_code == 0
         assert expected_saved_msg in result.output
         assert outfile.exists()
@@ -704,7 +697,7 @@ class TestDigestCommands:
     )
     def test_digest_invalid_format(self, subcommand: list[str], format_value: str) -> None:
         """digest commands fail with invalid format values."""
-        result = runner.invoke(app, ["digest", *subcommand, "--format", format_value])
+        result = runner.invoke(cli, ["digest", *subcommand, "--format", format_value])
         assert result.exit_code != 0
 
     @respx.mock
@@ -714,7 +707,7 @@ class TestDigestCommands:
             return_value=httpx.Response(200, json=_book(id=42, title="My Great Book"))
         )
         _mock_v2_highlights([_highlight(id=1, text="Book highlight")])
-        result = runner.invoke(app, ["digest", "book", "42"])
+        result = runner.invoke(cli, ["digest", "book", "42"])
         assert result.exit_code == 0
         assert "My Great Book" in result.output
         assert "Book highlight" in result.output
@@ -727,7 +720,7 @@ class TestDigestCommands:
         )
         _mock_v2_highlights([_highlight(id=1, text="Book file content")])
         outfile = tmp_path / "book.md"
-        result = runner.invoke(app, ["digest", "book", "42", "-o", str(outfile)])
+        result = runner.invoke(cli, ["digest", "book", "42", "-o", str(outfile)])
         assert result.exit_code == 0
         assert "Saved book digest" in result.output
         assert outfile.exists()
@@ -758,7 +751,7 @@ class TestTagsListCommand:
                 _highlight(id=5, text="H5", tags=[Tag(id=3, name="ai")]),
             ]
         )
-        result = runner.invoke(app, ["tags", "list"])
+        result = runner.invoke(cli, ["tags", "list"])
         assert result.exit_code == 0
         for tag in ("python", "coding", "ai"):
             assert tag in result.output
@@ -777,7 +770,7 @@ class TestTagsListCommand:
                 _highlight(id=3, text="H3", tags=[Tag(id=2, name="coding")]),
             ]
         )
-        result = runner.invoke(app, ["tags", "list", "--json"])
+        result = runner.invoke(cli, ["tags", "list", "--json"])
         assert result.exit_code == 0
         data = _extract_json(result.output)
         assert data["total_tags"] == 2
@@ -795,7 +788,7 @@ class TestTagsListCommand:
                 _highlight(id=4, text="H4", tags=[Tag(id=4, name="Coding")]),
             ]
         )
-        result = runner.invoke(app, ["tags", "list"])
+        result = runner.invoke(cli, ["tags", "list"])
         assert result.exit_code == 0
         assert "duplicates" in result.output.lower() or "Potential" in result.output
 
@@ -817,7 +810,7 @@ class TestTagsSearchCommand:
                 _highlight(id=3, text="JavaScript basics", tags=[Tag(id=3, name="javascript")]),
             ]
         )
-        result = runner.invoke(app, ["tags", "search", "python"])
+        result = runner.invoke(cli, ["tags", "search", "python"])
         assert result.exit_code == 0
         assert "Python programming" in result.output
         assert "Python data science" in result.output
@@ -832,7 +825,7 @@ class TestTagsSearchCommand:
                 _highlight(id=2, text="No match"),
             ]
         )
-        result = runner.invoke(app, ["tags", "search", "test", "--json"])
+        result = runner.invoke(cli, ["tags", "search", "test", "--json"])
         assert result.exit_code == 0
         data = json.loads(result.output)
         assert len(data) == 1
@@ -853,7 +846,7 @@ class TestTagsUntaggedCommand:
                 _highlight(id=3, text="Has a tag", tags=[Tag(id=1, name="tagged")]),
             ]
         )
-        result = runner.invoke(app, ["tags", "untagged"])
+        result = runner.invoke(cli, ["tags", "untagged"])
         assert result.exit_code == 0
         assert "No tags here" in result.output
         assert "Also no tags" in result.output
@@ -863,7 +856,7 @@ class TestTagsUntaggedCommand:
     def test_tags_untagged_json(self) -> None:
         """tags untagged --json outputs JSON."""
         _mock_v2_highlights([_highlight(id=10, text="Untagged highlight")])
-        result = runner.invoke(app, ["tags", "untagged", "--json"])
+        result = runner.invoke(cli, ["tags", "untagged", "--json"])
         assert result.exit_code == 0
         data = json.loads(result.output)
         assert len(data) == 1
@@ -877,7 +870,7 @@ class TestTagsUntaggedCommand:
                 _highlight(id=1, text="Tagged", tags=[Tag(id=1, name="some-tag")]),
             ]
         )
-        result = runner.invoke(app, ["tags", "untagged"])
+        result = runner.invoke(cli, ["tags", "untagged"])
         assert result.exit_code == 0
 
 
@@ -895,7 +888,7 @@ class TestAutoTagCommand:
             ]
         )
         result = runner.invoke(
-            app,
+            cli,
             ["tags", "auto-tag", "--pattern", "python", "--tag", "python"],
         )
         assert result.exit_code == 0
@@ -908,7 +901,7 @@ class TestAutoTagCommand:
         """tags auto-tag reports when no highlights match."""
         _mock_v2_highlights([_highlight(id=1, text="Nothing matching here")])
         result = runner.invoke(
-            app,
+            cli,
             ["tags", "auto-tag", "--pattern", "nomatch", "--tag", "test"],
         )
         assert result.exit_code == 0
@@ -919,7 +912,7 @@ class TestAutoTagCommand:
         """tags auto-tag truncates output for many results."""
         _mock_v2_highlights([_highlight(id=i, text=f"test content {i}") for i in range(15)])
         result = runner.invoke(
-            app,
+            cli,
             ["tags", "auto-tag", "--pattern", "test", "--tag", "tag"],
         )
         assert result.exit_code == 0
@@ -936,34 +929,37 @@ class TestTagMutationCommands:
 
     @respx.mock
     @pytest.mark.parametrize(
-        ("cli_args", "expected_count"),
+        ("cli_args", "tag_names", "expected_count"),
         [
-            (["tags", "rename", "old-tag", "new-tag"], "3 highlights"),
-            (["tags", "delete", "old-tag"], "3 highlights"),
-            (["tags", "merge", "tag1,tag2", "--into", "merged"], "2 highlights"),
+            (
+                ["tags", "rename", "old-tag", "new-tag"],
+                ["old-tag", "old-tag", "old-tag", "other"],
+                "3 highlights",
+            ),
+            (
+                ["tags", "delete", "old-tag"],
+                ["old-tag", "old-tag", "old-tag", "other"],
+                "3 highlights",
+            ),
+            (
+                ["tags", "merge", "tag1,tag2", "--into", "merged"],
+                ["tag1", "tag2", "other"],
+                "2 highlights",
+            ),
         ],
         ids=["rename", "delete", "merge"],
     )
-    def test_dry_run_with_matches(self, cli_args: list[str], expected_count: str) -> None:
+    def test_dry_run_with_matches(
+        self, cli_args: list[str], tag_names: list[str], expected_count: str
+    ) -> None:
         """Mutation commands show DRY RUN, match count, and hint."""
-        if "merge" in cli_args:
-            _mock_v2_highlights(
-                [
-                    _highlight(id=1, text="H1", tags=[Tag(id=10, name="tag1")]),
-                    _highlight(id=2, text="H2", tags=[Tag(id=20, name="tag2")]),
-                    _highlight(id=3, text="H3", tags=[Tag(id=30, name="other")]),
-                ]
-            )
-        else:
-            _mock_v2_highlights(
-                [
-                    _highlight(id=1, text="H1", tags=[Tag(id=10, name="old-tag")]),
-                    _highlight(id=2, text="H2", tags=[Tag(id=10, name="old-tag")]),
-                    _highlight(id=3, text="H3", tags=[Tag(id=10, name="old-tag")]),
-                    _highlight(id=4, text="H4", tags=[Tag(id=20, name="other")]),
-                ]
-            )
-        result = runner.invoke(app, cli_args)
+        _mock_v2_highlights(
+            [
+                _highlight(id=i, text=f"H{i}", tags=[Tag(id=10 * i, name=name)])
+                for i, name in enumerate(tag_names, start=1)
+            ]
+        )
+        result = runner.invoke(cli, cli_args)
         assert result.exit_code == 0
         assert "DRY RUN" in result.output
         assert expected_count in result.output
@@ -987,13 +983,13 @@ class TestTagMutationCommands:
                 _highlight(id=1, text="H1", tags=[Tag(id=10, name="other")]),
             ]
         )
-        result = runner.invoke(app, cli_args)
+        result = runner.invoke(cli, cli_args)
         assert result.exit_code == 0
         assert "No highlights found" in result.output
 
     def test_merge_tags_missing_into(self) -> None:
         """tags merge fails when --into is not provided."""
-        result = runner.invoke(app, ["tags", "merge", "tag1,tag2"])
+        result = runner.invoke(cli, ["tags", "merge", "tag1,tag2"])
         assert result.exit_code != 0
 
     @respx.mock
@@ -1002,7 +998,7 @@ class TestTagMutationCommands:
         _mock_v2_highlights(
             [_highlight(id=i, text=f"H{i}", tags=[Tag(id=10, name="big-tag")]) for i in range(15)]
         )
-        result = runner.invoke(app, ["tags", "delete", "big-tag"])
+        result = runner.invoke(cli, ["tags", "delete", "big-tag"])
         assert result.exit_code == 0
         assert "15 highlights" in result.output
         assert "5 more" in result.output
@@ -1033,7 +1029,7 @@ class TestTagReportCommand:
             ],
         ]
         _mock_v2_highlights(highlights)
-        result = runner.invoke(app, ["tags", "report"])
+        result = runner.invoke(cli, ["tags", "report"])
         assert result.exit_code == 0
         assert "Tag Report" in result.output
         assert "Total Tags: 4" in result.output
@@ -1060,7 +1056,7 @@ class TestTagReportCommand:
                 _highlight(id=5, text="H5", tags=[Tag(id=3, name="ai")]),
             ]
         )
-        result = runner.invoke(app, ["tags", "report", "--json"])
+        result = runner.invoke(cli, ["tags", "report", "--json"])
         assert result.exit_code == 0
         data = _extract_json(result.output)
         assert data["summary"]["total_tags"] == 3
@@ -1071,7 +1067,7 @@ class TestTagReportCommand:
     def test_tag_report_no_data(self) -> None:
         """tags report handles empty data."""
         _mock_v2_highlights([])
-        result = runner.invoke(app, ["tags", "report"])
+        result = runner.invoke(cli, ["tags", "report"])
         assert result.exit_code == 0
         assert "Total Tags: 0" in result.output
 
@@ -1086,7 +1082,7 @@ class TestNoArgsHelp:
 
     def test_no_args_shows_help(self) -> None:
         """Running the app with no arguments shows help (exit code 0 or 2)."""
-        result = runner.invoke(app, [])
+        result = runner.invoke(cli, [])
         assert result.exit_code in (0, 2)
         assert "Readwise SDK CLI" in result.output or "Usage" in result.output
 
@@ -1096,6 +1092,6 @@ class TestNoArgsHelp:
     )
     def test_subcommand_no_args_shows_help(self, subcommand: str) -> None:
         """Sub-apps with no args show help (exit code 0 or 2)."""
-        result = runner.invoke(app, [subcommand])
+        result = runner.invoke(cli, [subcommand])
         assert result.exit_code in (0, 2)
         assert "Usage" in result.output or subcommand in result.output
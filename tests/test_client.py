@@ -4,7 +4,13 @@ import httpx
 import pytest
 import respx
 
-from readwise_sdk.client import READWISE_API_V2_BASE, AsyncReadwiseClient, ReadwiseClient
+from readwise_sdk.client import (
+    DEFAULT_LIMITS,
+    READWISE_API_V2_BASE,
+    READWISE_API_V3_BASE,
+    AsyncReadwiseClient,
+    ReadwiseClient,
+)
 from readwise_sdk.exceptions import (
     AuthenticationError,
     NotFoundError,
@@ -156,6 +162,28 @@ def test_client_context_manager(api_key: str) -> None:
     assert client._client is None
 
 
+def test_client_limits(api_key: str, captured_httpx_kwargs: dict) -> None:
+    """Test that connection pool limits default sensibly and reach the HTTP client."""
+    assert ReadwiseClient(api_key=api_key).limits == DEFAULT_LIMITS
+
+    limits = httpx.Limits(max_connections=500, max_keepalive_connections=50)
+    client = ReadwiseClient.create_optional(api_key=api_key, limits=limits)
+    _ = client.client
+
+    assert client.limits == limits
+    assert captured_httpx_kwargs["limits"] == limits
+    assert captured_httpx_kwargs["http2"] is False
+
+
+def test_http2_opt_in(api_key: str, captured_httpx_kwargs: dict) -> None:
+    """Test that http2=True is passed through to the HTTP client."""
+    client = ReadwiseClient(api_key=api_key, http2=True)
+    _ = client.client
+
+    assert client.http2 is True
+    assert captured_httpx_kwargs["http2"] is True
+
+
 @respx.mock
 def test_validate_token_success(api_key: str) -> None:
     """Test successful token validation."""
@@ -232,6 +260,45 @@ def test_handle_500(api_key: str) -> None:
     assert exc_info.value.status_code == 500
 
 
+@respx.mock
+def test_count_results_uses_envelope_count(api_key: str) -> None:
+    """Test that a reported count is returned without fetching further pages."""
+    route = respx.get(f"{READWISE_API_V2_BASE}/highlights/").mock(
+        return_value=httpx.Response(
+            200,
+            json={
+                "count": 1234,
+                "results": [{"id": 1}],
+                "next": f"{READWISE_API_V2_BASE}/highlights/?page=2",
+            },
+        )
+    )
+
+    client = ReadwiseClient(api_key=api_key)
+
+    assert client.count_results(f"{READWISE_API_V2_BASE}/highlights/") == 1234
+    assert route.call_count == 1
+
+
+@respx.mock
+def test_count_results_without_count(api_key: str) -> None:
+    """Test that cursor pages are walked when no count is reported."""
+    route = respx.get(url__startswith=f"{READWISE_API_V3_BASE}/list/")
+    route.side_effect = [
+        httpx.Response(200, json={"results": [{"id": "a"}, {"id": "b"}], "nextPageCursor": "c2"}),
+        httpx.Response(200, json={"results": [{"id": "c"}], "nextPageCursor": None}),
+    ]
+
+    client = ReadwiseClient(api_key=api_key)
+    total = client.count_results(
+        f"{READWISE_API_V3_BASE}/list/", params={"location": "new"}, cursor_key="nextPageCursor"
+    )
+
+    assert total == 3
+    assert route.calls.last.request.url.params["pageCursor"] == "c2"
+    assert route.calls.last.request.url.params["location"] == "new"
+
+
 @respx.mock
 def test_pagination(api_key: str) -> None:
     """Test pagination through results."""
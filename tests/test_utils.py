@@ -1,14 +1,18 @@
 """Tests for internal utility functions."""
 
-from datetime import UTC, datetime
+import re
+from datetime import UTC, datetime, timedelta
 
 import httpx
 import pytest
 
 from readwise_sdk._utils import (
     handle_response,
+    make_pattern_matcher,
+    make_text_matcher,
     parse_datetime_string,
     parse_pagination_cursor,
+    resolve_since,
     truncate_string,
 )
 from readwise_sdk.exceptions import (
@@ -156,6 +160,12 @@ class TestParseDatetimeString:
         result = parse_datetime_string("2024-01-15T12:30:00Z")
         assert result is not None
         assert result.year == 2024
+        assert result.utcoffset() == timedelta(0)
+
+    def test_fractional_seconds_with_z_suffix(self) -> None:
+        """Test parsing the microsecond timestamps the API returns."""
+        result = parse_datetime_string("2024-01-15T12:30:00.123456Z")
+        assert result == datetime(2024, 1, 15, 12, 30, 0, 123456, tzinfo=UTC)
 
     def test_invalid_string_returns_none(self) -> None:
         """Test that invalid string returns None."""
@@ -166,6 +176,31 @@ class TestParseDatetimeString:
         assert parse_datetime_string("2024-01") is None
 
 
+class TestResolveSince:
+    """Tests for resolve_since function."""
+
+    def test_since_takes_precedence(self) -> None:
+        """Test that an explicit since is returned unchanged."""
+        since = datetime(2024, 1, 1, tzinfo=UTC)
+        assert resolve_since(days=7, since=since) is since
+
+    @pytest.mark.parametrize(
+        ("kwargs", "expected"),
+        [({"days": 7}, timedelta(days=7)), ({"hours": 24}, timedelta(hours=24))],
+        ids=["days", "hours"],
+    )
+    def test_lookback(self, kwargs: dict, expected: timedelta) -> None:
+        """Test that days/hours are subtracted from the current UTC time."""
+        before = datetime.now(UTC)
+        result = resolve_since(**kwargs)
+        assert before - expected <= result <= datetime.now(UTC) - expected
+
+    def test_requires_an_argument(self) -> None:
+        """Test that a missing lookback raises before any request is made."""
+        with pytest.raises(ValueError, match="Must specify days, hours, or since"):
+            resolve_since()
+
+
 class TestTruncateString:
     """Tests for truncate_string function."""
 
@@ -202,3 +237,60 @@ class TestTruncateString:
         value, was_truncated = truncate_string(text, 10)
         assert value == "abcdefg..."
         assert was_truncated is True
+
+
+class TestMakeTextMatcher:
+    """Tests for make_text_matcher function."""
+
+    def test_case_insensitive(self) -> None:
+        """Test that matching ignores case by default."""
+        matches = make_text_matcher("python")
+        assert matches("Learning PYTHON today")
+        assert not matches("JavaScript")
+
+    def test_case_insensitive_uses_casefold(self) -> None:
+        """Test that case-insensitive matching folds beyond simple lowercasing."""
+        assert make_text_matcher("strasse")("Hauptstraße")
+
+    def test_case_sensitive(self) -> None:
+        """Test that case-sensitive matching respects case."""
+        matches = make_text_matcher("Python", case_sensitive=True)
+        assert matches("Python rocks")
+        assert not matches("python rocks")
+
+    def test_query_is_literal(self) -> None:
+        """Test that regex metacharacters in the query are matched literally."""
+        matches = make_text_matcher("c++ (intro)")
+        assert matches("A C++ (Intro) course")
+        assert not matches("c intro")
+
+    @pytest.mark.parametrize("case_sensitive", [True, False])
+    def test_none_does_not_match(self, case_sensitive: bool) -> None:
+        """Test that missing fields never match a non-empty query."""
+        assert not make_text_matcher("x", case_sensitive=case_sensitive)(None)
+
+
+class TestMakePatternMatcher:
+    """Tests for make_pattern_matcher."""
+
+    @pytest.mark.parametrize(
+        ("pattern", "text"),
+        [
+            ("strasse", "Hauptstraße"),
+            ("stras{2}e", "Hauptstraße"),
+            ("python", "I love PYTHON"),
+            ("py.hon", "I love PYTHON"),
+            ("k", "\u212a"),
+            ("s", "\u017f"),
+        ],
+    )
+    @pytest.mark.parametrize("case_sensitive", [True, False])
+    def test_agrees_with_regex(self, pattern: str, text: str, case_sensitive: bool) -> None:
+        """Test that literal patterns match exactly the texts the regex would."""
+        expected = re.search(pattern, text, 0 if case_sensitive else re.IGNORECASE) is not None
+        assert make_pattern_matcher(pattern, case_sensitive=case_sensitive)(text) is expected
+
+    def test_none_is_empty_text(self) -> None:
+        """Test that a missing field is searched as an empty string."""
+        assert not make_pattern_matcher("x")(None)
+        assert make_pattern_matcher("^$")(None)
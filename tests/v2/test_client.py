@@ -97,6 +97,44 @@ class TestHighlights:
         assert "highlighted_at__gt=" in url_str
         assert "highlighted_at__lt=" in url_str
 
+    @respx.mock
+    def test_count_highlights(self, api_key: str) -> None:
+        """Test that counting requests a single-item page and reads its count."""
+        route = respx.get(f"{READWISE_API_V2_BASE}/highlights/").mock(
+            return_value=httpx.Response(
+                200, json={"count": 42, "results": [{"id": 1, "text": "x"}], "next": "p2"}
+            )
+        )
+
+        client = ReadwiseClient(api_key=api_key)
+
+        assert client.v2.count_highlights() == 42
+        assert route.call_count == 1
+        assert route.calls.last.request.url.params["page_size"] == "1"
+
+    @respx.mock
+    def test_count_highlights_without_count(self, api_key: str) -> None:
+        """Test that a missing count is walked at the normal page size, not one item a page."""
+        url = f"{READWISE_API_V2_BASE}/highlights/"
+
+        def respond(request: httpx.Request) -> httpx.Response:
+            page_size = int(request.url.params["page_size"])
+            page = int(request.url.params.get("page", 1))
+            total = 150
+            start = (page - 1) * page_size
+            results = [{"id": i, "text": "x"} for i in range(start, min(start + page_size, total))]
+            more = start + page_size < total
+            next_url = f"{url}?page={page + 1}&page_size={page_size}" if more else None
+            return httpx.Response(200, json={"results": results, "next": next_url})
+
+        route = respx.get(url).mock(side_effect=respond)
+
+        client = ReadwiseClient(api_key=api_key)
+
+        assert client.v2.count_highlights() == 150
+        sizes = [call.request.url.params["page_size"] for call in route.calls]
+        assert sizes == ["1", "100", "100"]
+
     @respx.mock
     def test_get_highlight(self, api_key: str) -> None:
         """Test getting a single highlight."""
@@ -253,6 +291,18 @@ class TestBooks:
         assert "last_highlight_at__gt=" in url_str
         assert "last_highlight_at__lt=" in url_str
 
+    @respx.mock
+    def test_count_books(self, api_key: str) -> None:
+        """Test that counting books requests a single-item page."""
+        route = respx.get(f"{READWISE_API_V2_BASE}/books/").mock(
+            return_value=httpx.Response(200, json={"count": 7, "results": [], "next": None})
+        )
+
+        client = ReadwiseClient(api_key=api_key)
+
+        assert client.v2.count_books() == 7
+        assert route.calls.last.request.url.params["page_size"] == "1"
+
     @respx.mock
     def test_get_book(self, api_key: str) -> None:
         """Test getting a single book."""
@@ -124,6 +124,21 @@ class TestDocuments:
         assert "withHtmlContent=true" in str(request.url)
         assert len(documents) == 1
 
+    @respx.mock
+    def test_count_documents(self, api_key: str) -> None:
+        """Test counting documents in a location from the reported count."""
+        route = respx.get(f"{READWISE_API_V3_BASE}/list/").mock(
+            return_value=httpx.Response(
+                200, json={"count": 12, "results": [], "nextPageCursor": "abc"}
+            )
+        )
+
+        client = ReadwiseClient(api_key=api_key)
+
+        assert client.v3.count_documents(location=DocumentLocation.LATER) == 12
+        assert route.call_count == 1
+        assert route.calls.last.request.url.params["location"] == "later"
+
     @respx.mock
     def test_get_document(self, api_key: str) -> None:
         """Test getting a single document."""
@@ -11,6 +11,9 @@ from readwise_sdk.client import READWISE_API_V2_BASE, ReadwiseClient
 from readwise_sdk.workflows.digest import DigestBuilder, DigestFormat
 from tests.workflows.conftest import mock_v2_highlights
 
+_TODAY = datetime(2024, 1, 15, 12, 0, tzinfo=UTC)
+_YESTERDAY = _TODAY - timedelta(days=1)
+
 
 class TestDigestBuilder:
     """Tests for DigestBuilder."""
@@ -110,13 +113,10 @@ class TestDigestBuilder:
     @respx.mock
     def test_digest_group_by_date(self, client: ReadwiseClient) -> None:
         """Test grouping highlights by date."""
-        now = datetime.now(UTC)
-        yesterday = now - timedelta(days=1)
-
         mock_v2_highlights(
             [
-                {"id": 1, "text": "Today highlight", "highlighted_at": now.isoformat()},
-                {"id": 2, "text": "Yesterday highlight", "highlighted_at": yesterday.isoformat()},
+                {"id": 1, "text": "Today highlight", "highlighted_at": _TODAY.isoformat()},
+                {"id": 2, "text": "Yesterday highlight", "highlighted_at": _YESTERDAY.isoformat()},
             ]
         )
 
@@ -133,21 +133,18 @@ class TestDigestBuilder:
     @respx.mock
     def test_text_format_group_by_date(self, client: ReadwiseClient) -> None:
         """Test text output format with date grouping."""
-        now = datetime.now(UTC)
-        yesterday = now - timedelta(days=1)
-
         mock_v2_highlights(
             [
                 {
                     "id": 1,
                     "text": "Today text highlight",
                     "note": "A note",
-                    "highlighted_at": now.isoformat(),
+                    "highlighted_at": _TODAY.isoformat(),
                 },
                 {
                     "id": 2,
                     "text": "Yesterday text highlight",
-                    "highlighted_at": yesterday.isoformat(),
+                    "highlighted_at": _YESTERDAY.isoformat(),
                 },
             ]
         )
@@ -163,8 +160,8 @@ class TestDigestBuilder:
         assert "Today text highlight" in digest
         assert "Yesterday text highlight" in digest
         assert "Note: A note" in digest
-        assert now.strftime("%Y-%m-%d") in digest
-        assert yesterday.strftime("%Y-%m-%d") in digest
+        assert "2024-01-15" in digest
+        assert "2024-01-14" in digest
 
     @respx.mock
     def test_text_format_ungrouped(self, client: ReadwiseClient) -> None:
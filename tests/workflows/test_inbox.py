@@ -66,6 +66,23 @@ class TestArchiveRules:
         assert rule.condition(newsletter_doc) is True
         assert rule.condition(article_doc) is False
 
+    def test_create_title_pattern_rule_regex(self) -> None:
+        """Test that patterns with regex metacharacters are matched as regexes."""
+        rule = create_title_pattern_rule(r"^re:", "replies")
+
+        assert rule.condition(Document(id="1", url="https://example.com", title="RE: hi")) is True
+        assert rule.condition(Document(id="2", url="https://example.com", title="Hi re:")) is False
+
+    def test_create_title_pattern_rule_non_ascii(self) -> None:
+        """Test that literal and regex patterns agree on non-ASCII titles."""
+        doc = Document(id="1", url="https://example.com", title="Hauptstraße")
+
+        assert create_title_pattern_rule(r"strasse", "literal").condition(doc) is False
+        assert create_title_pattern_rule(r"stras{2}e", "regex").condition(doc) is False
+        assert create_title_pattern_rule(r"STRASSE", "ascii").condition(
+            Document(id="2", url="https://example.com", title="Hauptstrasse")
+        )
+
     def test_create_domain_rule(self) -> None:
         """Test creating domain rule."""
         rule = create_domain_rule("twitter.com")
@@ -103,8 +120,8 @@ class TestReadingInbox:
         now = datetime.now(UTC)
 
         def mock_response(request: httpx.Request) -> httpx.Response:
-            url = str(request.url)
-            if "location=new" in url:
+            location = request.url.params.get("location")
+            if location == "new":
                 return httpx.Response(
                     200,
                     json={
@@ -125,7 +142,7 @@ class TestReadingInbox:
                         "nextPageCursor": None,
                     },
                 )
-            elif "location=later" in url:
+            elif location == "later":
                 return httpx.Response(
                     200,
                     json={
@@ -152,6 +169,9 @@ class TestReadingInbox:
         assert stats.reading_list_count == 1
         assert stats.total_unread == 3
         assert stats.items_older_than_30_days == 1
+        assert stats.items_older_than_90_days == 0
+        assert stats.oldest_item_age_days == 45
+        assert stats.average_age_days == 20
         assert stats.by_category["article"] == 2
         assert stats.by_category["pdf"] == 1
 
@@ -219,14 +239,14 @@ class TestReadingInbox:
             [
                 {"id": "doc1", "url": "https://a.com", "title": "Python Tutorial"},
                 {"id": "doc2", "url": "https://b.com", "title": "JavaScript Guide"},
+                {"id": "doc3", "url": "https://c.com", "summary": "Notes on PYTHON"},
             ]
         )
 
         inbox = ReadingInbox(client)
-        results = inbox.search_inbox("python")
 
-        assert len(results) == 1
-        assert results[0].id == "doc1"
+        assert [d.id for d in inbox.search_inbox("python")] == ["doc1", "doc3"]
+        assert [d.id for d in inbox.search_inbox("Python", case_sensitive=True)] == ["doc1"]
 
     @respx.mock
     def test_get_inbox_by_priority(self, client: ReadwiseClient) -> None:
@@ -370,8 +390,8 @@ class TestReadingInbox:
         now = datetime.now(UTC)
 
         def mock_response(request: httpx.Request) -> httpx.Response:
-            url = str(request.url)
-            if "location=new" in url:
+            location = request.url.params.get("location")
+            if location == "new":
                 return httpx.Response(
                     200,
                     json={
@@ -386,7 +406,7 @@ class TestReadingInbox:
                         "nextPageCursor": None,
                     },
                 )
-            elif "location=later" in url:
+            elif location == "later":
                 return httpx.Response(
                     200,
                     json={
@@ -1,5 +1,7 @@
 """Tests for TagWorkflow."""
 
+from dataclasses import asdict
+
 import httpx
 import pytest
 import respx
@@ -49,6 +51,43 @@ class TestTagPattern:
         assert pattern.matches(Highlight(id=1, text="I love Python")) is True
         assert pattern.matches(Highlight(id=2, text="I love python")) is False
 
+    @pytest.mark.parametrize(
+        ("pattern", "text", "expected"),
+        [
+            (r"python", "I love PYTHON", True),
+            (r"py.hon", "I love PYTHON", True),
+            (r"^love", "I love python", False),
+            (r"strasse", "Straße", False),
+            (r"stras{2}e", "Straße", False),
+        ],
+        ids=["literal", "regex", "anchored_regex", "literal_non_ascii", "regex_non_ascii"],
+    )
+    def test_literal_and_regex_patterns(self, pattern: str, text: str, expected: bool) -> None:
+        """Test that literal and regex patterns both match case-insensitively."""
+        tag_pattern = TagPattern(pattern=pattern, tag="python")
+        assert tag_pattern.matches(Highlight(id=1, text=text)) is expected
+
+    def test_reassigned_fields_take_effect(self) -> None:
+        """Test that changing pattern or case_sensitive after creation is honoured."""
+        pattern = TagPattern(pattern=r"Python", tag="python", case_sensitive=True)
+        pattern.case_sensitive = False
+        assert pattern.matches(Highlight(id=1, text="I love python")) is True
+
+        pattern.pattern = r"rust"
+        assert pattern.matches(Highlight(id=2, text="I love python")) is False
+
+    def test_matcher_cache_is_not_a_field(self) -> None:
+        """Test that the cached matcher stays out of the dataclass fields."""
+        pattern = TagPattern(pattern=r"python", tag="python")
+        assert pattern.matches(Highlight(id=1, text="Python"))
+        assert asdict(pattern) == {
+            "pattern": "python",
+            "tag": "python",
+            "case_sensitive": False,
+            "match_in_notes": True,
+            "match_in_text": True,
+        }
+
 
 class TestTagWorkflow:
     """Tests for TagWorkflow."""